@@ -18,14 +18,21 @@ from .database import close_db, get_session, init_db, is_initialized
 from .store import (
     count_runs,
     count_steps,
+    create_payload_rows,
     create_payloads,
     create_run,
+    create_runs,
     create_step,
+    create_steps,
     end_run,
+    end_runs,
     end_step,
+    end_steps,
     get_payloads,
     get_run,
+    get_runs,
     get_step,
+    get_steps,
     list_runs,
     list_steps,
 )
@@ -40,15 +47,22 @@ __all__ = [
     "is_initialized",
     # Store functions
     "create_run",
+    "create_runs",
     "end_run",
+    "end_runs",
     "create_step",
+    "create_steps",
     "end_step",
+    "end_steps",
     "get_run",
+    "get_runs",
     "get_step",
+    "get_steps",
     "list_runs",
     "list_steps",
     "count_runs",
     "count_steps",
+    "create_payload_rows",
     "create_payloads",
     "get_payloads",
 ]
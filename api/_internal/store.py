@@ -18,7 +18,7 @@ from enum import Enum, auto
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -66,13 +66,13 @@ async def create_run(
     Returns:
         The created Run record.
     """
-    run = Run(
+    run = _new_run(
         id=id,
         pipeline_name=pipeline_name,
         status=status,
         started_at=started_at,
         input_summary=input_summary,
-        metadata_=metadata,
+        metadata=metadata,
         request_id=request_id,
         user_id=user_id,
         environment=environment,
@@ -83,6 +83,51 @@ async def create_run(
     return run
 
 
+def _new_run(
+    *,
+    id: UUID,
+    pipeline_name: str,
+    status: str,
+    started_at: datetime,
+    input_summary: dict[str, Any] | None = None,
+    metadata: dict[str, Any] | None = None,
+    request_id: str | None = None,
+    user_id: str | None = None,
+    environment: str | None = None,
+) -> Run:
+    """Build an unsaved Run from create_run's keyword arguments."""
+    return Run(
+        id=id,
+        pipeline_name=pipeline_name,
+        status=status,
+        started_at=started_at,
+        input_summary=input_summary,
+        metadata_=metadata,
+        request_id=request_id,
+        user_id=user_id,
+        environment=environment,
+    )
+
+
+async def create_runs(session: AsyncSession, runs: list[dict[str, Any]]) -> list[Run]:
+    """Create multiple Run records in a single flush.
+
+    Called for the run_start events of an ingest batch. Unlike create_run this
+    does not commit; the caller owns the transaction.
+
+    Args:
+        session: Database session
+        runs: One dict per run, with the same keys as create_run's keyword arguments
+
+    Returns:
+        The created Run records, in input order.
+    """
+    records = [_new_run(**fields) for fields in runs]
+    session.add_all(records)
+    await session.flush()
+    return records
+
+
 async def end_run(
     session: AsyncSession,
     *,
@@ -111,13 +156,62 @@ async def end_run(
     if run is None:
         return None
 
+    _apply_run_end(
+        run,
+        status=status,
+        ended_at=ended_at,
+        output_summary=output_summary,
+        error_message=error_message,
+    )
+
+    await session.commit()
+    return run
+
+
+def _apply_run_end(
+    run: Run,
+    *,
+    status: str,
+    ended_at: datetime,
+    output_summary: dict[str, Any] | None = None,
+    error_message: str | None = None,
+) -> None:
+    """Set completion fields on a loaded Run from end_run's keyword arguments."""
     run.status = status
     run.ended_at = ended_at
     run.output_summary = output_summary
     run.error_message = error_message
 
-    await session.commit()
-    return run
+
+async def end_runs(
+    session: AsyncSession,
+    ends: list[dict[str, Any]],
+    runs: dict[UUID, Run] | None = None,
+) -> dict[UUID, Run]:
+    """Update multiple Runs with completion data using one SELECT and one flush.
+
+    Called for the run_end events of an ingest batch. Updates are applied in
+    input order, so a later entry for the same run wins. Does not commit.
+
+    Args:
+        session: Database session
+        ends: One dict per run, with the same keys as end_run's keyword arguments
+        runs: Runs already loaded with get_runs; skips the SELECT when given
+
+    Returns:
+        Mapping of run ID to updated Run. Runs that don't exist are absent.
+    """
+    if runs is None:
+        runs = await get_runs(session, [fields["id"] for fields in ends])
+
+    for fields in ends:
+        updates = dict(fields)
+        run = runs.get(updates.pop("id"))
+        if run is not None:
+            _apply_run_end(run, **updates)
+
+    await session.flush()
+    return runs
 
 
 async def create_step(
@@ -154,7 +248,7 @@ async def create_step(
     Returns:
         The created Step record.
     """
-    step = Step(
+    step = _new_step(
         id=id,
         run_id=run_id,
         step_name=step_name,
@@ -164,13 +258,60 @@ async def create_step(
         status=status,
         input_summary=input_summary,
         input_count=input_count,
-        metadata_=metadata,
+        metadata=metadata,
     )
     session.add(step)
     await session.commit()
     return step
 
 
+def _new_step(
+    *,
+    id: UUID,
+    run_id: UUID,
+    step_name: str,
+    step_type: str,
+    index: int,
+    started_at: datetime,
+    status: str = "running",
+    input_summary: dict[str, Any] | None = None,
+    input_count: int | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> Step:
+    """Build an unsaved Step from create_step's keyword arguments."""
+    return Step(
+        id=id,
+        run_id=run_id,
+        step_name=step_name,
+        step_type=step_type,
+        index=index,
+        started_at=started_at,
+        status=status,
+        input_summary=input_summary,
+        input_count=input_count,
+        metadata_=metadata,
+    )
+
+
+async def create_steps(session: AsyncSession, steps: list[dict[str, Any]]) -> list[Step]:
+    """Create multiple Step records in a single flush.
+
+    Called for the step_start events of an ingest batch. Unlike create_step this
+    does not commit; the caller owns the transaction.
+
+    Args:
+        session: Database session
+        steps: One dict per step, with the same keys as create_step's keyword arguments
+
+    Returns:
+        The created Step records, in input order.
+    """
+    records = [_new_step(**fields) for fields in steps]
+    session.add_all(records)
+    await session.flush()
+    return records
+
+
 def _compute_removed_ratio(
     input_count: int | None, output_count: int | None
 ) -> float | None:
@@ -222,6 +363,33 @@ async def end_step(
     if step is None:
         return None
 
+    _apply_step_end(
+        step,
+        status=status,
+        ended_at=ended_at,
+        duration_ms=duration_ms,
+        output_summary=output_summary,
+        output_count=output_count,
+        reasoning=reasoning,
+        error_message=error_message,
+    )
+
+    await session.commit()
+    return step
+
+
+def _apply_step_end(
+    step: Step,
+    *,
+    status: str,
+    ended_at: datetime,
+    duration_ms: int | None = None,
+    output_summary: dict[str, Any] | None = None,
+    output_count: int | None = None,
+    reasoning: dict[str, Any] | None = None,
+    error_message: str | None = None,
+) -> None:
+    """Set completion fields on a loaded Step from end_step's keyword arguments."""
     step.status = status
     step.ended_at = ended_at
     step.duration_ms = duration_ms
@@ -231,8 +399,36 @@ async def end_step(
     step.reasoning = reasoning
     step.error_message = error_message
 
-    await session.commit()
-    return step
+
+async def end_steps(
+    session: AsyncSession,
+    ends: list[dict[str, Any]],
+    steps: dict[UUID, Step] | None = None,
+) -> dict[UUID, Step]:
+    """Update multiple Steps with completion data using one SELECT and one flush.
+
+    Called for the step_end events of an ingest batch. Updates are applied in
+    input order, so a later entry for the same step wins. Does not commit.
+
+    Args:
+        session: Database session
+        ends: One dict per step, with the same keys as end_step's keyword arguments
+        steps: Steps already loaded with get_steps; skips the SELECT when given
+
+    Returns:
+        Mapping of step ID to updated Step. Steps that don't exist are absent.
+    """
+    if steps is None:
+        steps = await get_steps(session, [fields["id"] for fields in ends])
+
+    for fields in ends:
+        updates = dict(fields)
+        step = steps.get(updates.pop("id"))
+        if step is not None:
+            _apply_step_end(step, **updates)
+
+    await session.flush()
+    return steps
 
 
 async def get_run(
@@ -273,6 +469,34 @@ async def get_step(session: AsyncSession, id: UUID) -> Step | None:
     return await session.get(Step, id)
 
 
+async def get_runs(session: AsyncSession, ids: list[UUID]) -> dict[UUID, Run]:
+    """Get several Runs by ID with a single SELECT (steps are not loaded).
+
+    Args:
+        session: Database session
+        ids: Run UUIDs to fetch
+
+    Returns:
+        Mapping of run ID to Run. Runs that don't exist are absent.
+    """
+    stmt = select(Run).where(Run.id.in_(set(ids)))
+    return {run.id: run for run in (await session.execute(stmt)).scalars()}
+
+
+async def get_steps(session: AsyncSession, ids: list[UUID]) -> dict[UUID, Step]:
+    """Get several Steps by ID with a single SELECT.
+
+    Args:
+        session: Database session
+        ids: Step UUIDs to fetch
+
+    Returns:
+        Mapping of step ID to Step. Steps that don't exist are absent.
+    """
+    stmt = select(Step).where(Step.id.in_(set(ids)))
+    return {step.id: step for step in (await session.execute(stmt)).scalars()}
+
+
 def _apply_run_filters(
     stmt,
     *,
@@ -451,6 +675,22 @@ async def create_payloads(
     return created
 
 
+async def create_payload_rows(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert many Payload rows with a single executemany.
+
+    Unlike create_payloads, rows may belong to different runs/steps/phases, so
+    a whole ingest batch's payloads can be written at once. Does not commit.
+
+    Args:
+        session: Database session
+        rows: Dicts with run_id, step_id, ref_id, phase and data keys
+    """
+    if not rows:
+        return
+
+    await session.execute(insert(Payload), rows)
+
+
 async def get_payloads(
     session: AsyncSession,
     *,
@@ -4,46 +4,153 @@ Environment variables take precedence over config file:
 - XRAY_DATABASE_URL: Database connection string
 - XRAY_DEBUG: Enable debug mode (true/false)
 - XRAY_API_KEY: API key for authentication (if set, auth is enabled)
+
+The discovered config file is mirrored to a `xray.config.yaml.json` sidecar so that
+subsequent processes (e.g. each uvicorn worker) can skip YAML parsing.
 """
 
 from __future__ import annotations
 
+import contextlib
+import json
 import os
+import stat
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from shared.config import find_config_file, get_section, load_yaml_file
 
+SIDECAR_SUFFIX = ".json"
+
+# Values of XRAY_DEBUG (case-insensitive) that enable debug mode
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.strip().lower() in _TRUTHY
+
+
+# (config key, environment variable, converter) - empty values are ignored
+_ENV_OVERRIDES: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("database_url", "XRAY_DATABASE_URL", str),
+    ("debug", "XRAY_DEBUG", _parse_bool),
+    ("api_key", "XRAY_API_KEY", str),
+)
+
 
 class APIConfig(BaseModel):
-    """API server configuration."""
+    """API server configuration. Immutable, so one instance can be shared freely."""
+
+    model_config = ConfigDict(frozen=True)
 
     database_url: str = "postgresql+asyncpg://localhost:5432/xray"
     debug: bool = False
     api_key: str | None = None
 
 
+_DEFAULT_CONFIG = APIConfig()
+
+
 def load_config(config_file: str | Path | None = None) -> APIConfig:
     """Load API configuration from xray.config.yaml.
 
     Environment variables take precedence over config file values.
     """
+    found_file: Path | None = None
+    stale_stamp: tuple[int, int] | None = None
     if config_file:
         yaml_config = load_yaml_file(config_file)
     else:
         found_file = find_config_file()
-        yaml_config = load_yaml_file(found_file) if found_file else {}
+        if found_file:
+            yaml_config, stale_stamp = _load_with_sidecar(found_file)
+        else:
+            yaml_config = {}
 
-    config: dict[str, Any] = get_section(yaml_config, "api")
+    # A copy, so env overrides don't leak into yaml_config (and from there into the sidecar)
+    config: dict[str, Any] = dict(get_section(yaml_config, "api"))
 
     # Environment variables override config file
-    if db_url := os.environ.get("XRAY_DATABASE_URL"):
-        config["database_url"] = db_url
-    if debug := os.environ.get("XRAY_DEBUG"):
-        config["debug"] = debug.lower() in ("true", "1", "yes")
-    if api_key := os.environ.get("XRAY_API_KEY"):
-        config["api_key"] = api_key
-
-    return APIConfig(**config)
+    env = os.environ
+    for key, env_var, convert in _ENV_OVERRIDES:
+        if value := env.get(env_var):
+            config[key] = convert(value)
+
+    # Frozen, so the defaults can be shared when neither YAML nor env set anything
+    api_config = APIConfig.model_validate(config) if config else _DEFAULT_CONFIG
+
+    # Don't leave sidecars behind while developing against the config file
+    if found_file and stale_stamp is not None and not api_config.debug:
+        _write_sidecar(found_file, yaml_config, stale_stamp)
+
+    return api_config
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar path for a YAML config file."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _load_with_sidecar(path: Path) -> tuple[dict[str, Any], tuple[int, int] | None]:
+    """Load a YAML config file, preferring its JSON sidecar when it is current.
+
+    The sidecar stores the YAML file's mtime_ns and size (size catches rewrites
+    within the filesystem's mtime granularity); any mismatch or decode error
+    falls back to parsing the YAML file.
+
+    Returns:
+        Tuple of (config dict, (mtime_ns, size) to record if the sidecar needs
+        rewriting or None if it is current).
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return {}, None
+    mtime_ns, size = stat_result.st_mtime_ns, stat_result.st_size
+
+    try:
+        cached = json.loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        cached = None
+
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == mtime_ns
+        and cached.get("size") == size
+        and isinstance(cached.get("config"), dict)
+    ):
+        return cached["config"], None
+
+    return load_yaml_file(path), (mtime_ns, size)
+
+
+def _write_sidecar(path: Path, yaml_config: dict[str, Any], stamp: tuple[int, int]) -> None:
+    """Atomically write the JSON sidecar for a YAML config file (best effort).
+
+    Skipped when the config does not round-trip through JSON unchanged
+    (e.g. YAML dates or non-string keys). The sidecar holds the same secrets
+    as the YAML file (e.g. api_key), so it gets the YAML file's permissions.
+    """
+    sidecar = _sidecar_path(path)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        mtime_ns, size = stamp
+        serialized = json.dumps({"mtime_ns": mtime_ns, "size": size, "config": yaml_config})
+        if json.loads(serialized)["config"] != yaml_config:
+            return
+        mode = stat.S_IMODE(path.stat().st_mode)
+        # Created owner-only and given the YAML file's mode before any content
+        # is written, so the secrets are never more widely readable than there
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            os.chmod(tmp_path, mode)
+            f.write(serialized)
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError, ValueError):
+        # Sidecar is an optimization only - never fail config loading over it
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
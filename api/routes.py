@@ -1,16 +1,21 @@
 """FastAPI route handlers for the X-Ray API.
 
 This module provides the /ingest endpoint that receives batched events
-from the SDK transport layer. Events are processed sequentially to
-maintain temporal dependencies (run before step, start before end).
+from the SDK transport layer. Events are written in bulk per event type,
+ordered to maintain temporal dependencies (run before step, start before end).
 """
 
 from __future__ import annotations
 
 import logging
+import zlib
+from collections.abc import Awaitable, Callable
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -18,7 +23,7 @@ logger = logging.getLogger(__name__)
 from ._internal import store
 from ._internal.database import get_session
 from .auth import verify_api_key
-from .models import Step
+from .models import Run, Step
 from .schemas import (
     EventResult,
     IngestEvent,
@@ -43,220 +48,421 @@ async def health() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-@router.post("/ingest", response_model=IngestResponse, dependencies=[Depends(verify_api_key)])
+# Upper bound on a gzip request body once decompressed, so a small request can't
+# inflate into an arbitrarily large buffer (decompression bomb)
+MAX_DECOMPRESSED_BODY_BYTES = 32 * 1024 * 1024
+
+# Compiled once - validates the raw JSON body straight into event models
+_EVENTS_ADAPTER = TypeAdapter(list[IngestEvent])
+
+
+def _ingest_body_schema() -> dict[str, Any]:
+    """JSON schema of the /ingest body for OpenAPI, with the event models inlined.
+
+    TypeAdapter.json_schema() refers to the event models through "#/$defs/...",
+    which does not resolve inside the OpenAPI document, so each reference is
+    replaced by its definition. The discriminator mapping points into $defs as
+    well and is dropped; each event model's event_type const still tells them apart.
+    """
+    schema = _EVENTS_ADAPTER.json_schema()
+    defs = schema.pop("$defs")
+    items = schema["items"]
+    items["oneOf"] = [defs[ref["$ref"].rsplit("/", 1)[-1]] for ref in items["oneOf"]]
+    items["discriminator"] = {"propertyName": items["discriminator"]["propertyName"]}
+    return schema
+
+
+# Order in which event groups are written - parents before children, starts before ends
+_EVENT_ORDER = ("run_start", "step_start", "step_end", "run_end")
+
+
+# The body is read from the raw Request, so FastAPI can't derive it - documented explicitly
+@router.post(
+    "/ingest",
+    response_model=IngestResponse,
+    dependencies=[Depends(verify_api_key)],
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _ingest_body_schema()}},
+            "required": True,
+        }
+    },
+)
 async def ingest_events(
-    events: list[IngestEvent],
+    request: Request,
     session: AsyncSession = Depends(get_session),
-) -> IngestResponse:
+) -> Response:
     """Ingest a batch of events from the SDK.
 
-    Processes events sequentially in the order received. Each event
-    is handled independently - failures in one event don't affect others.
+    Events are grouped by event_type and each group is written with a single
+    bulk statement, in dependency order (run_start, step_start, step_end,
+    run_end). If a bulk write fails, that group falls back to processing its
+    events one at a time so each event still succeeds or fails independently.
+    Externalized payloads of all saved events are then written with one bulk
+    insert. Results are returned in the order events were received.
+
+    The whole batch is one transaction, committed once at the end. Each write
+    runs in a SAVEPOINT, so a failure only rolls back its own group or event.
 
     Always returns HTTP 200 with success/failure counts in the body.
     This supports fail-open semantics - the SDK should not retry
     on partial failures.
 
+    The body is a JSON list of events (run_start, run_end, step_start, step_end),
+    validated with a precompiled TypeAdapter rather than FastAPI's body parsing,
+    and the response is serialized by pydantic-core, so JSON never goes through
+    the stdlib json module on this path.
+
     Args:
-        events: List of events (run_start, run_end, step_start, step_end)
+        request: Incoming request carrying the JSON event list
         session: Database session (injected)
 
     Returns:
-        IngestResponse with processed/succeeded/failed counts and per-event results.
+        JSON-encoded IngestResponse with processed/succeeded/failed counts and
+        per-event results.
+
+    Raises:
+        RequestValidationError: 422 if the body is not a valid event list
     """
-    results: list[EventResult] = []
+    events = await _parse_events(request)
 
-    for event in events:
+    groups: dict[str, list[int]] = {event_type: [] for event_type in _EVENT_ORDER}
+    for i, event in enumerate(events):
+        groups[event.event_type].append(i)
+
+    errors: list[str | None] = [None] * len(events)
+    pending: _PendingPayloads = []
+    succeeded = 0
+    for event_type in _EVENT_ORDER:
+        indices = groups[event_type]
+        if not indices:
+            continue
+
+        group = [events[i] for i in indices]
         try:
-            await _process_event(session, event)
-            results.append(
-                EventResult(
-                    id=event.id,
-                    event_type=event.event_type,
-                    success=True,
-                )
-            )
-        except Exception as e:
+            async with session.begin_nested():
+                group_errors = await _GROUP_HANDLERS[event_type](session, group, pending)
+        except Exception:
             logger.exception(
-                "Error processing event %s of type %s", event.id, event.event_type
+                "Bulk write of %d %s events failed, retrying one at a time",
+                len(group),
+                event_type,
             )
-            results.append(
-                EventResult(
-                    id=event.id,
-                    event_type=event.event_type,
-                    success=False,
-                    error=str(e),
-                )
-            )
-
-    succeeded = sum(1 for r in results if r.success)
-    return IngestResponse(
+            group_errors = await _retry_singly(session, event_type, group, pending)
+
+        for i, error in zip(indices, group_errors):
+            errors[i] = error
+            if error is None:
+                succeeded += 1
+
+    await _store_payloads(session, pending)
+    await session.commit()
+
+    # model_construct skips validation - every value comes from an already-validated event
+    results = [
+        EventResult.model_construct(
+            id=event.id,
+            event_type=event.event_type,
+            success=error is None,
+            error=error,
+        )
+        for event, error in zip(events, errors)
+    ]
+
+    response = IngestResponse.model_construct(
         processed=len(events),
         succeeded=succeeded,
         failed=len(events) - succeeded,
         results=results,
     )
+    # Serialize with pydantic-core directly instead of FastAPI's jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
-async def _process_event(session: AsyncSession, event: IngestEvent) -> None:
-    """Process a single event, dispatching to the appropriate handler.
+async def _parse_events(request: Request) -> list[IngestEvent]:
+    """Validate the request body as a list of ingest events.
 
-    Args:
-        session: Database session
-        event: The event to process (discriminated union)
+    The SDK gzips larger batches, so a `Content-Encoding: gzip` body is
+    decompressed first, up to MAX_DECOMPRESSED_BODY_BYTES.
 
     Raises:
-        ValueError: If referenced run/step not found
-        Exception: Database errors propagate up
-    """
-    match event.event_type:
-        case "run_start":
-            await _handle_run_start(session, event)
-        case "run_end":
-            await _handle_run_end(session, event)
-        case "step_start":
-            await _handle_step_start(session, event)
-        case "step_end":
-            await _handle_step_end(session, event)
-
-
-async def _handle_run_start(session: AsyncSession, event: RunStartEvent) -> None:
-    """Handle run_start event - creates a new Run record.
-
-    Also stores any externalized payloads from the _payloads field.
-    Payload failures are logged but don't fail the event (run is already saved).
+        HTTPException: 400 for a corrupt gzip body, 413 for one that decompresses
+            past the limit, 415 for other encodings
+        RequestValidationError: With FastAPI-style ("body", ...) error locations
     """
-    await store.create_run(
-        session,
-        id=event.id,
-        pipeline_name=event.pipeline_name,
-        status=event.status,
-        started_at=event.started_at,
-        input_summary=event.input_summary,
-        metadata=event.metadata,
-        request_id=event.request_id,
-        user_id=event.user_id,
-        environment=event.environment,
-    )
-
-    # Store externalized payloads if present
-    # Failures are logged but don't fail the event (run is already committed)
-    if event.payloads:
-        try:
-            await store.create_payloads(
-                session,
-                run_id=event.id,
-                step_id=None,  # Run-level payloads
-                phase="input",
-                payloads=event.payloads,
-            )
-        except Exception:
-            logger.exception("Failed to store payloads for run %s", event.id)
+    body = await request.body()
+    encoding = request.headers.get("content-encoding", "identity").lower()
+    if encoding == "gzip":
+        body = _gunzip(body)
+    elif encoding != "identity":
+        raise HTTPException(status_code=415, detail=f"Unsupported Content-Encoding: {encoding}")
+
+    try:
+        return _EVENTS_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors) from e
+
+
+def _gunzip(body: bytes) -> bytes:
+    """Decompress a single-member gzip body with a bounded output size."""
+    limit = MAX_DECOMPRESSED_BODY_BYTES
+    decompressor = zlib.decompressobj(wbits=31)  # 31: gzip header and trailer
+    try:
+        data = decompressor.decompress(body, limit + 1)
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail="Invalid gzip request body") from e
+    if len(data) > limit:
+        raise HTTPException(
+            status_code=413, detail=f"Decompressed request body exceeds {limit} bytes"
+        )
+    # Truncated streams and trailing data are corrupt bodies, as with gzip.decompress
+    if not decompressor.eof or decompressor.unused_data:
+        raise HTTPException(status_code=400, detail="Invalid gzip request body")
+    return data
+
+
+# (run_id, step_id, phase, event) for each saved event whose payloads are still to be written
+_PendingPayloads = list[tuple[UUID, UUID | None, str, IngestEvent]]
+
+# Bulk handler for one event type: (session, events, pending) -> per-event error or None
+_GroupHandler = Callable[[AsyncSession, list[Any], _PendingPayloads], Awaitable[list[str | None]]]
+# Bulk loader of end-event targets by ID, and an end handler given those targets
+_TargetLoader = Callable[[AsyncSession, list[UUID]], Awaitable[dict[UUID, Any]]]
+_EndHandler = Callable[
+    [AsyncSession, list[Any], _PendingPayloads, dict[UUID, Any]], Awaitable[list[str | None]]
+]
+
+
+async def _handle_run_starts(
+    session: AsyncSession, events: list[RunStartEvent], pending: _PendingPayloads
+) -> list[str | None]:
+    """Bulk-handle run_start events - creates all Run records in one flush."""
+    await store.create_runs(session, [_run_start_fields(e) for e in events])
+    for event in events:
+        _defer_payloads(pending, run_id=event.id, step_id=None, phase="input", event=event)
+    return [None] * len(events)
 
 
-async def _handle_run_end(session: AsyncSession, event: RunEndEvent) -> None:
-    """Handle run_end event - updates existing Run with completion data.
+async def _handle_run_ends(
+    session: AsyncSession,
+    events: list[RunEndEvent],
+    pending: _PendingPayloads,
+    targets: dict[UUID, Run] | None = None,
+) -> list[str | None]:
+    """Bulk-handle run_end events - updates all existing Runs in one flush.
 
-    Raises:
-        ValueError: If the run doesn't exist
+    `targets` are Runs already loaded by _retry_singly, which saves the SELECT.
     """
-    result = await store.end_run(
-        session,
-        id=event.id,
-        status=event.status,
-        ended_at=event.ended_at,
-        output_summary=event.output_summary,
-        error_message=event.error_message,
-    )
+    runs = await store.end_runs(session, [_run_end_fields(e) for e in events], targets)
+    errors: list[str | None] = [
+        None if event.id in runs else f"Run {event.id} not found" for event in events
+    ]
+    for event, error in zip(events, errors):
+        if error is None:
+            _defer_payloads(pending, run_id=event.id, step_id=None, phase="output", event=event)
+    return errors
+
+
+async def _handle_step_starts(
+    session: AsyncSession, events: list[StepStartEvent], pending: _PendingPayloads
+) -> list[str | None]:
+    """Bulk-handle step_start events - creates all Step records in one flush."""
+    await store.create_steps(session, [_step_start_fields(e) for e in events])
+    for event in events:
+        _defer_payloads(
+            pending, run_id=event.run_id, step_id=event.id, phase="input", event=event
+        )
+    return [None] * len(events)
 
-    if result is None:
-        raise ValueError(f"Run {event.id} not found")
 
-    # Store externalized payloads if present
-    # Failures are logged but don't fail the event (run is already committed)
-    if event.payloads:
+async def _handle_step_ends(
+    session: AsyncSession,
+    events: list[StepEndEvent],
+    pending: _PendingPayloads,
+    targets: dict[UUID, Step] | None = None,
+) -> list[str | None]:
+    """Bulk-handle step_end events - updates all existing Steps in one flush.
+
+    `targets` are Steps already loaded by _retry_singly, which saves the SELECT.
+    """
+    steps = await store.end_steps(session, [_step_end_fields(e) for e in events], targets)
+    errors: list[str | None] = []
+    for event in events:
+        step = steps.get(event.id)
+        if step is None:
+            errors.append(f"Step {event.id} not found")
+            continue
+        errors.append(None)
+        _defer_payloads(
+            pending, run_id=step.run_id, step_id=event.id, phase="output", event=event
+        )
+    return errors
+
+
+async def _retry_singly(
+    session: AsyncSession, event_type: str, group: list[Any], pending: _PendingPayloads
+) -> list[str | None]:
+    """Process a group one event at a time after its bulk write failed.
+
+    Each event is written by the same bulk handler in its own SAVEPOINT. For end
+    events the targets are loaded with one SELECT first and handed to the
+    handler, so missing runs or steps fail without a query of their own and
+    found ones are updated without another SELECT.
+    """
+    handler = _GROUP_HANDLERS[event_type]
+    label, fetch, end_handler = _END_TARGETS.get(event_type, ("", None, None))
+    found: dict[UUID, Any] | None = None
+    if fetch is not None:
         try:
-            await store.create_payloads(
-                session,
-                run_id=event.id,
-                step_id=None,  # Run-level payloads
-                phase="output",
-                payloads=event.payloads,
-            )
+            async with session.begin_nested():
+                found = await fetch(session, [event.id for event in group])
         except Exception:
-            logger.exception("Failed to store payloads for run %s", event.id)
+            logger.exception("Prefetch of %d %s targets failed", len(group), event_type)
 
+    errors: list[str | None] = []
+    for event in group:
+        if found is not None and event.id not in found:
+            errors.append(f"{label} {event.id} not found")
+            continue
+        try:
+            async with session.begin_nested():
+                if found is not None and end_handler is not None:
+                    event_errors = await end_handler(session, [event], pending, found)
+                else:
+                    event_errors = await handler(session, [event], pending)
+            errors.extend(event_errors)
+        except Exception as e:
+            logger.exception("Error processing event %s of type %s", event.id, event_type)
+            errors.append(str(e))
+            # The rollback expired the loaded target, so later events load their own
+            found = None
+    return errors
 
-async def _handle_step_start(session: AsyncSession, event: StepStartEvent) -> None:
-    """Handle step_start event - creates a new Step record.
 
-    Also stores any externalized payloads from the _payloads field.
-    Payload failures are logged but don't fail the event (step is already saved).
-    """
-    await store.create_step(
-        session,
-        id=event.id,
-        run_id=event.run_id,
-        step_name=event.step_name,
-        step_type=event.step_type,
-        index=event.index,
-        started_at=event.started_at,
-        status="running",
-        input_summary=event.input_summary,
-        input_count=event.input_count,
-        metadata=event.metadata,
-    )
-
-    # Store externalized payloads if present
-    # Failures are logged but don't fail the event (step is already committed)
+def _defer_payloads(
+    pending: _PendingPayloads,
+    *,
+    run_id: UUID,
+    step_id: UUID | None,
+    phase: str,
+    event: IngestEvent,
+) -> None:
+    """Queue an event's externalized payloads, if it has any, for _store_payloads."""
     if event.payloads:
-        try:
-            await store.create_payloads(
-                session,
-                run_id=event.run_id,
-                step_id=event.id,
-                phase="input",
-                payloads=event.payloads,
-            )
-        except Exception:
-            logger.exception("Failed to store payloads for step %s", event.id)
+        pending.append((run_id, step_id, phase, event))
 
 
-async def _handle_step_end(session: AsyncSession, event: StepEndEvent) -> None:
-    """Handle step_end event - updates existing Step with completion data.
+async def _store_payloads(session: AsyncSession, pending: _PendingPayloads) -> None:
+    """Write all queued payloads for a batch with a single bulk insert.
 
-    Raises:
-        ValueError: If the step doesn't exist
+    If the bulk insert fails, payloads are retried one event at a time so a bad
+    payload only loses that event's payloads. Failures are logged but don't fail
+    any event (its run/step is already written).
     """
-    result = await store.end_step(
-        session,
-        id=event.id,
-        status=event.status,
-        ended_at=event.ended_at,
-        duration_ms=event.duration_ms,
-        output_summary=event.output_summary,
-        output_count=event.output_count,
-        reasoning=event.reasoning,
-        error_message=event.error_message,
-    )
-
-    if result is None:
-        raise ValueError(f"Step {event.id} not found")
-
-    # Store externalized payloads if present
-    # Use result.run_id (verified from DB) instead of event.run_id for data consistency
-    # Failures are logged but don't fail the event (step is already committed)
-    if event.payloads:
+    if not pending:
+        return
+
+    try:
+        async with session.begin_nested():
+            await store.create_payload_rows(session, _payload_rows(pending))
+        return
+    except Exception:
+        logger.exception(
+            "Bulk write of payloads for %d events failed, retrying per event", len(pending)
+        )
+
+    for entry in pending:
         try:
-            await store.create_payloads(
-                session,
-                run_id=result.run_id,  # Use verified run_id from database
-                step_id=event.id,
-                phase="output",
-                payloads=event.payloads,
-            )
+            async with session.begin_nested():
+                await store.create_payload_rows(session, _payload_rows([entry]))
         except Exception:
-            logger.exception("Failed to store payloads for step %s", event.id)
+            _, step_id, _, event = entry
+            owner = "step" if step_id is not None else "run"
+            logger.exception("Failed to store payloads for %s %s", owner, event.id)
+
+
+def _payload_rows(pending: _PendingPayloads) -> list[dict[str, Any]]:
+    """Flatten queued payloads into rows for store.create_payload_rows."""
+    return [
+        {"run_id": run_id, "step_id": step_id, "ref_id": ref_id, "phase": phase, "data": data}
+        for run_id, step_id, phase, event in pending
+        # _defer_payloads only queues events with payloads; `or {}` narrows the Optional
+        for ref_id, data in (event.payloads or {}).items()
+    ]
+
+
+def _run_start_fields(event: RunStartEvent) -> dict[str, Any]:
+    """Map a run_start event to store.create_run keyword arguments."""
+    return {
+        "id": event.id,
+        "pipeline_name": event.pipeline_name,
+        "status": event.status,
+        "started_at": event.started_at,
+        "input_summary": event.input_summary,
+        "metadata": event.metadata,
+        "request_id": event.request_id,
+        "user_id": event.user_id,
+        "environment": event.environment,
+    }
+
+
+def _run_end_fields(event: RunEndEvent) -> dict[str, Any]:
+    """Map a run_end event to store.end_run keyword arguments."""
+    return {
+        "id": event.id,
+        "status": event.status,
+        "ended_at": event.ended_at,
+        "output_summary": event.output_summary,
+        "error_message": event.error_message,
+    }
+
+
+def _step_start_fields(event: StepStartEvent) -> dict[str, Any]:
+    """Map a step_start event to store.create_step keyword arguments."""
+    return {
+        "id": event.id,
+        "run_id": event.run_id,
+        "step_name": event.step_name,
+        "step_type": event.step_type,
+        "index": event.index,
+        "started_at": event.started_at,
+        "status": "running",
+        "input_summary": event.input_summary,
+        "input_count": event.input_count,
+        "metadata": event.metadata,
+    }
+
+
+def _step_end_fields(event: StepEndEvent) -> dict[str, Any]:
+    """Map a step_end event to store.end_step keyword arguments."""
+    return {
+        "id": event.id,
+        "status": event.status,
+        "ended_at": event.ended_at,
+        "duration_ms": event.duration_ms,
+        "output_summary": event.output_summary,
+        "output_count": event.output_count,
+        "reasoning": event.reasoning,
+        "error_message": event.error_message,
+    }
+
+
+# End event type -> (label for "not found" errors, bulk loader of its targets,
+# handler that takes the loaded targets)
+_END_TARGETS: dict[str, tuple[str, _TargetLoader, _EndHandler]] = {
+    "run_end": ("Run", store.get_runs, _handle_run_ends),
+    "step_end": ("Step", store.get_steps, _handle_step_ends),
+}
+# Event type -> bulk handler. The discriminated union guarantees every key is present.
+_GROUP_HANDLERS: dict[str, _GroupHandler] = {
+    "run_start": _handle_run_starts,
+    "run_end": _handle_run_ends,
+    "step_start": _handle_step_starts,
+    "step_end": _handle_step_ends,
+}
 
 
 # =============================================================================
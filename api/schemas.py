@@ -19,14 +19,24 @@ from pydantic import BaseModel, ConfigDict, Field
 # =============================================================================
 
 
-class RunStartEvent(BaseModel):
-    """Event sent when a run begins.
+class _EventBase(BaseModel):
+    """Fields and config shared by all ingest events.
 
-    Created by SDK's Run.__init__ and sent via transport.
+    The SDK sends externalized data under `_payloads`; the alias is resolved by
+    pydantic-core, so declaring it once here adds no per-event Python work.
     """
 
     model_config = ConfigDict(populate_by_name=True)
 
+    payloads: dict[str, Any] | None = Field(default=None, alias="_payloads")
+
+
+class RunStartEvent(_EventBase):
+    """Event sent when a run begins.
+
+    Created by SDK's Run.__init__ and sent via transport.
+    """
+
     event_type: Literal["run_start"]
     id: UUID
     pipeline_name: str
@@ -37,34 +47,28 @@ class RunStartEvent(BaseModel):
     request_id: str | None = None
     user_id: str | None = None
     environment: str | None = None
-    payloads: dict[str, Any] | None = Field(default=None, alias="_payloads")
 
 
-class RunEndEvent(BaseModel):
+class RunEndEvent(_EventBase):
     """Event sent when a run completes or errors.
 
     Created by SDK's Run.end() and sent via transport.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     event_type: Literal["run_end"]
     id: UUID
     status: Literal["success", "error"]
     ended_at: datetime
     output_summary: dict[str, Any] | None = None
     error_message: str | None = None
-    payloads: dict[str, Any] | None = Field(default=None, alias="_payloads")
 
 
-class StepStartEvent(BaseModel):
+class StepStartEvent(_EventBase):
     """Event sent when a step begins.
 
     Created by SDK's Step.__init__ and sent via transport.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     event_type: Literal["step_start"]
     id: UUID
     run_id: UUID
@@ -75,17 +79,14 @@ class StepStartEvent(BaseModel):
     input_summary: dict[str, Any] | None = None
     input_count: int | None = None
     metadata: dict[str, Any] | None = None
-    payloads: dict[str, Any] | None = Field(default=None, alias="_payloads")
 
 
-class StepEndEvent(BaseModel):
+class StepEndEvent(_EventBase):
     """Event sent when a step completes or errors.
 
     Created by SDK's Step.end() and sent via transport.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
-
     event_type: Literal["step_end"]
     id: UUID
     run_id: UUID
@@ -96,7 +97,6 @@ class StepEndEvent(BaseModel):
     output_count: int | None = None
     reasoning: dict[str, Any] | None = None
     error_message: str | None = None
-    payloads: dict[str, Any] | None = Field(default=None, alias="_payloads")
 
 
 # Discriminated union for automatic event type routing
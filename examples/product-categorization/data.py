@@ -1,5 +1,7 @@
 """Product categorization data - taxonomy and sample products."""
 
+import sys
+
 # Simplified e-commerce category taxonomy (in reality, could be 10,000+ categories)
 CATEGORY_TAXONOMY = {
     "Electronics": {
@@ -55,6 +57,31 @@ CATEGORY_TAXONOMY = {
 }
 
 
+# Taxonomy flattened once into parallel tuples, one entry per subcategory, so the
+# pipeline can index subcategories by position instead of walking nested dicts.
+# Terms are lowercased here (product text is matched lowercased) and interned
+# along with the ids, so the matching hot path never normalizes them.
+_flat = [
+    (
+        sys.intern(sub_data["id"]),
+        parent_name,
+        sub_name,
+        tuple(sys.intern(kw.lower()) for kw in sub_data["keywords"]),
+        tuple(sys.intern(sig.lower()) for sig in sub_data["signals"]),
+    )
+    for parent_name, parent_data in CATEGORY_TAXONOMY.items()
+    for sub_name, sub_data in parent_data["subcategories"].items()
+]
+SUB_IDS, SUB_PARENTS, SUB_NAMES, SUB_KEYWORDS, SUB_SIGNALS = (tuple(col) for col in zip(*_flat))
+TAXONOMY_SIZE = len(SUB_IDS)
+
+# "Parent > Subcategory" display label for each subcategory id
+SUB_DISPLAY = {
+    sub_id: f"{parent} > {name}" for sub_id, parent, name in zip(SUB_IDS, SUB_PARENTS, SUB_NAMES)
+}
+del _flat
+
+
 # Sample products for testing categorization
 TEST_PRODUCTS = [
     {
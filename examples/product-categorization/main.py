@@ -17,6 +17,9 @@ Usage:
 
     # Run this example
     python main.py
+
+    # Or categorize all products in one run, as a single batch step
+    python main.py --batch
 """
 
 import sys
@@ -24,10 +27,32 @@ import sys
 from sdk import XRayConfig, init_xray, shutdown_xray
 
 from data import TEST_PRODUCTS
-from pipeline import categorize_product
-
-
-def main() -> None:
+from pipeline import categorize_batch, categorize_product
+
+
+def run_batch(client) -> list[dict]:
+    """Categorize every test product in one run with the batch path."""
+    with client.start_run(
+        pipeline_name="product-categorization-batch",
+        input_data={"product_count": len(TEST_PRODUCTS)},
+    ):
+        assignments = categorize_batch(TEST_PRODUCTS)
+
+    results = []
+    for product, result in zip(TEST_PRODUCTS, assignments):
+        results.append({
+            "product": product["title"],
+            "assigned_category": result["category_id"],
+            "expected_category": product["expected_category"],
+            "confidence": result["confidence"],
+            "correct": result["category_id"] == product["expected_category"],
+        })
+        print(f"  {'✓' if results[-1]['correct'] else '✗'} {product['title'][:50]}"
+              f" -> {result['category_name']} ({result['confidence']:.0%})")
+    return results
+
+
+def main(batch: bool = False) -> None:
     # Initialize X-Ray SDK
     print("Initializing X-Ray SDK...")
     print("Connecting to: http://localhost:8000")
@@ -45,42 +70,55 @@ def main() -> None:
         # Run categorization for each test product
         results = []
 
-        for i, product in enumerate(TEST_PRODUCTS, 1):
-            print(f"\n[{i}/{len(TEST_PRODUCTS)}] Categorizing: {product['title'][:50]}...")
-            print("-" * 80)
-
-            # Create a run for this categorization
-            with client.start_run(
-                pipeline_name="product-categorization",
-                input_data={
-                    "title": product["title"],
-                    "description": product["description"][:100],
-                },
-                metadata={
-                    "product_index": i,
-                    "expected_category": product["expected_category"],
-                    "challenge": product["challenge"],
-                },
-            ):
-                result = categorize_product(
-                    product["title"],
-                    product["description"]
+        if batch:
+            results = run_batch(client)
+        else:
+            # Per-product fields (and the truncated description) prepared once
+            prepared = [
+                (
+                    p["title"],
+                    p["description"],
+                    p["description"][:100],
+                    p["expected_category"],
+                    p["challenge"],
                 )
-
-                results.append({
-                    "product": product["title"],
-                    "assigned_category": result.get("category_id"),
-                    "expected_category": product["expected_category"],
-                    "confidence": result.get("confidence", 0.0),
-                    "correct": result.get("category_id") == product["expected_category"],
-                })
-
-                # Display result
-                print(f"  Category: {result.get('category_name', 'None')}")
-                print(f"  Category ID: {result.get('category_id', 'None')}")
-                print(f"  Confidence: {result.get('confidence', 0.0):.0%}")
-                print(f"  Expected: {product['expected_category']}")
-                print(f"  Match: {'✓' if results[-1]['correct'] else '✗'}")
+                for p in TEST_PRODUCTS
+            ]
+            total = len(prepared)
+
+            for i, (title, description, preview, expected, challenge) in enumerate(prepared, 1):
+                print(f"\n[{i}/{total}] Categorizing: {title[:50]}...")
+                print("-" * 80)
+
+                # Create a run for this categorization
+                with client.start_run(
+                    pipeline_name="product-categorization",
+                    input_data={"title": title, "description": preview},
+                    metadata={
+                        "product_index": i,
+                        "expected_category": expected,
+                        "challenge": challenge,
+                    },
+                ):
+                    result = categorize_product(title, description)
+
+                    category_id = result.get("category_id")
+                    confidence = result.get("confidence", 0.0)
+                    correct = category_id == expected
+                    results.append({
+                        "product": title,
+                        "assigned_category": category_id,
+                        "expected_category": expected,
+                        "confidence": confidence,
+                        "correct": correct,
+                    })
+
+                    # Display result
+                    print(f"  Category: {result.get('category_name', 'None')}")
+                    print(f"  Category ID: {category_id}")
+                    print(f"  Confidence: {confidence:.0%}")
+                    print(f"  Expected: {expected}")
+                    print(f"  Match: {'✓' if correct else '✗'}")
 
         print("\n" + "=" * 80)
         print("Categorization Complete!")
@@ -120,7 +158,7 @@ def main() -> None:
 
 if __name__ == "__main__":
     try:
-        main()
+        main(batch="--batch" in sys.argv[1:])
     except KeyboardInterrupt:
         print("\nInterrupted")
         shutdown_xray(timeout=2.0)
@@ -8,30 +8,118 @@ This pipeline demonstrates automatic product categorization with decision transp
 - Select best-fit category with confidence score
 """
 
-from sdk import attach_reasoning, step
+import functools
+import re
+from operator import itemgetter
+
+from sdk import attach_reasoning, current_step, step
+
+from data import (
+    SUB_DISPLAY,
+    SUB_IDS,
+    SUB_KEYWORDS,
+    SUB_NAMES,
+    SUB_PARENTS,
+    SUB_SIGNALS,
+    TAXONOMY_SIZE,
+)
+
+# Whitespace-delimited words longer than 3 characters, punctuation included
+_KEYWORD_RE = re.compile(r"\S{4,}")
+_STOPWORDS = frozenset({"with", "this", "that", "from", "have", "been"})
+# Known brands, matched anywhere in the text with one alternation scan
+_BRANDS = ("apple", "samsung", "sony", "lg")
+_BRAND_RE = re.compile("|".join(map(re.escape, _BRANDS)))
+
+# C-level sort key for score_categories (no Python lambda call per comparison key)
+_by_score = itemgetter("score")
+
+# Inverted index from each distinct keyword/signal to the subcategories using
+# it, as (subcategory position, 0 for keyword / 1 for signal).
+_TERM_INDEX: dict[str, list[tuple[int, int]]] = {}
+for _position, _terms in enumerate(zip(SUB_KEYWORDS, SUB_SIGNALS)):
+    for _kind, _kind_terms in enumerate(_terms):
+        for _term in _kind_terms:
+            _TERM_INDEX.setdefault(_term, []).append((_position, _kind))
+
+# Terms that are a single whitespace-free word are matched via the index by
+# length; anything else (multi-word signals) is matched by substring scan.
+_WORD_TERMS = {term for term in _TERM_INDEX if term.split() == [term]}
+_WORD_TERM_LENGTHS = tuple(sorted({len(term) for term in _WORD_TERMS}))
+_PHRASE_TERMS = tuple(term for term in _TERM_INDEX if term not in _WORD_TERMS)
+
+
+# Feed refreshes and retries re-categorize the same products, so the pure text
+# work behind the steps is memoized. The steps themselves still run (and are
+# traced) every time; they build fresh dicts from the cached immutable results.
+@functools.lru_cache(maxsize=4096)
+def _extract_terms(title: str, description: str) -> tuple[str, tuple[str, ...], int, bool]:
+    """Return (lowercased text, keywords, word count, has_brand) for a product."""
+    text = f"{title} {description}".lower()
 
-from data import CATEGORY_TAXONOMY
+    # Simple attribute extraction (in production, this might use NLP/LLM)
+    words = text.split()
+
+    # Extract key terms, deduplicated in order of first appearance and limited to 20;
+    # scanning stops as soon as 20 distinct terms have been seen
+    keywords: dict[str, None] = {}
+    for match in _KEYWORD_RE.finditer(text):
+        word = match[0]
+        if word not in _STOPWORDS and word not in keywords:
+            keywords[word] = None
+            if len(keywords) == 20:
+                break
+
+    return (
+        text,
+        tuple(keywords),
+        len(words),
+        _BRAND_RE.search(text) is not None,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_term_hits(text: str) -> tuple[tuple[int, int, int], ...]:
+    """Return (subcategory position, keyword matches, signal matches) for each match."""
+    # A term without whitespace can only occur inside a single word of the text, so
+    # those are found by looking up each word's substrings (of the lengths that
+    # terms actually have) in the index - work proportional to the text, not the
+    # taxonomy. Only multi-word terms like "screen protector" are scanned for.
+    matched = set(filter(text.__contains__, _PHRASE_TERMS))
+    for word in set(text.split()):
+        word_length = len(word)
+        for start in range(word_length):
+            for length in _WORD_TERM_LENGTHS:
+                if start + length > word_length:
+                    break
+                piece = word[start:start + length]
+                if piece in _WORD_TERMS:
+                    matched.add(piece)
+
+    hits: dict[int, list[int]] = {}
+    for term in matched:
+        for position, kind in _TERM_INDEX[term]:
+            hits.setdefault(position, [0, 0])[kind] += 1
+
+    return tuple((position, *hits[position]) for position in sorted(hits))
+
+
+def clear_caches() -> None:
+    """Clear the memoized text processing caches."""
+    _extract_terms.cache_clear()
+    _count_term_hits.cache_clear()
 
 
 @step(step_type="transform")
 def extract_attributes(title: str, description: str) -> dict:
     """Extract product attributes from title and description."""
-    text = (title + " " + description).lower()
-
-    # Simple attribute extraction (in production, this might use NLP/LLM)
-    words = text.split()
-
-    # Extract key terms
-    keywords = [
-        w for w in words
-        if len(w) > 3 and w not in {"with", "this", "that", "from", "have", "been"}
-    ]
+    text, keywords, word_count, has_brand = _extract_terms(title, description)
 
     attributes = {
         "all_text": text,
-        "keywords": list(set(keywords))[:20],  # Dedupe and limit
-        "word_count": len(words),
-        "has_brand": any(brand in text for brand in ["apple", "samsung", "sony", "lg"]),
+        "keywords": list(keywords),
+        "word_count": word_count,
+        "has_brand": has_brand,
     }
 
     attach_reasoning({
@@ -46,30 +134,22 @@ def extract_attributes(title: str, description: str) -> dict:
 @step(step_type="retrieval")
 def find_candidate_categories(attributes: dict) -> list[dict]:
     """Find all categories that could potentially match this product."""
-    candidates = []
     text = attributes["all_text"]
 
-    # Scan taxonomy for matches
-    for parent_name, parent_data in CATEGORY_TAXONOMY.items():
-        for sub_name, sub_data in parent_data["subcategories"].items():
-            # Check if any category keywords appear in product text
-            keyword_matches = sum(1 for kw in sub_data["keywords"] if kw in text)
-            signal_matches = sum(1 for sig in sub_data["signals"] if sig in text)
-
-            if keyword_matches > 0 or signal_matches > 0:
-                candidates.append({
-                    "id": sub_data["id"],
-                    "parent": parent_name,
-                    "name": sub_name,
-                    "keyword_matches": keyword_matches,
-                    "signal_matches": signal_matches,
-                    "total_matches": keyword_matches + signal_matches,
-                })
+    candidates = [
+        {
+            "id": SUB_IDS[position],
+            "parent": SUB_PARENTS[position],
+            "name": SUB_NAMES[position],
+            "keyword_matches": keyword_matches,
+            "signal_matches": signal_matches,
+            "total_matches": keyword_matches + signal_matches,
+        }
+        for position, keyword_matches, signal_matches in _count_term_hits(text)
+    ]
 
     attach_reasoning({
-        "taxonomy_size": sum(
-            len(p["subcategories"]) for p in CATEGORY_TAXONOMY.values()
-        ),
+        "taxonomy_size": TAXONOMY_SIZE,
         "candidates_found": len(candidates),
         "had_matches": len(candidates) > 0,
     })
@@ -80,22 +160,25 @@ def find_candidate_categories(attributes: dict) -> list[dict]:
 @step(step_type="filter")
 def filter_weak_candidates(candidates: list[dict], min_score: int = 2) -> list[dict]:
     """Filter out categories with too few matches."""
-    filtered = [c for c in candidates if c["total_matches"] >= min_score]
-
-    removed_candidates = [
-        {"id": c["id"], "name": c["name"], "score": c["total_matches"]}
-        for c in candidates
-        if c["total_matches"] < min_score
-    ]
-
-    attach_reasoning({
-        "filter_criterion": "minimum_match_score",
-        "threshold": min_score,
-        "input_count": len(candidates),
-        "output_count": len(filtered),
-        "removed_count": len(removed_candidates),
-        "removed_candidates": removed_candidates,
-    })
+    # Single pass partition; removed candidates are kept by reference only
+    filtered: list[dict] = []
+    removed: list[dict] = []
+    for c in candidates:
+        (filtered if c["total_matches"] >= min_score else removed).append(c)
+
+    # The per-candidate reasoning payload is only built when a step is recording it
+    if current_step() is not None:
+        attach_reasoning({
+            "filter_criterion": "minimum_match_score",
+            "threshold": min_score,
+            "input_count": len(candidates),
+            "output_count": len(filtered),
+            "removed_count": len(removed),
+            "removed_candidates": [
+                {"id": c["id"], "name": c["name"], "score": c["total_matches"]}
+                for c in removed
+            ],
+        })
 
     return filtered
 
@@ -110,7 +193,7 @@ def score_categories(candidates: list[dict]) -> list[dict]:
             candidate["signal_matches"] * 2.0
         )
 
-    ranked = sorted(candidates, key=lambda x: x["score"], reverse=True)
+    ranked = sorted(candidates, key=_by_score, reverse=True)
 
     attach_reasoning({
         "scoring_formula": "keyword_matches * 1.0 + signal_matches * 2.0",
@@ -124,6 +207,14 @@ def score_categories(candidates: list[dict]) -> list[dict]:
     return ranked
 
 
+def _gap_confidence(top_scores: list[float]) -> tuple[float, bool]:
+    """Return (confidence, ambiguous) from the top one or two ranked scores."""
+    if len(top_scores) > 1:
+        score_gap = top_scores[0] - top_scores[1]
+        return min(0.9, 0.5 + (score_gap * 0.1)), score_gap < 1.0
+    return 0.95, False
+
+
 @step(step_type="llm")  # In production, this would use an actual LLM
 def resolve_ambiguity(
     candidates: list[dict], product_title: str, product_desc: str
@@ -146,13 +237,7 @@ def resolve_ambiguity(
     top_candidate = candidates[0]
 
     # Calculate confidence based on score gap
-    if len(candidates) > 1:
-        score_gap = top_candidate["score"] - candidates[1]["score"]
-        confidence = min(0.9, 0.5 + (score_gap * 0.1))
-        ambiguous = score_gap < 1.0
-    else:
-        confidence = 0.95
-        ambiguous = False
+    confidence, ambiguous = _gap_confidence([c["score"] for c in candidates[:2]])
 
     # Context for reasoning
     reasoning_data = {
@@ -174,7 +259,7 @@ def resolve_ambiguity(
 
     return {
         "category_id": top_candidate["id"],
-        "category_name": f"{top_candidate['parent']} > {top_candidate['name']}",
+        "category_name": SUB_DISPLAY[top_candidate["id"]],
         "confidence": round(confidence, 2),
         "reason": f"Best match with {top_candidate['total_matches']} signals",
     }
@@ -218,3 +303,58 @@ def categorize_product(title: str, description: str) -> dict:
     result = resolve_ambiguity(ranked_candidates, title, description)
 
     return result
+
+
+@step(step_type="transform")
+def categorize_batch(products: list[dict]) -> list[dict]:
+    """Categorize many products in a single step.
+
+    Applies the same matching, filtering, scoring and confidence rules as
+    categorize_product, so assignments agree with it, but records one step for
+    the whole batch instead of five per product. Use it for bulk runs where
+    per-product decision traces aren't needed.
+
+    Args:
+        products: Dicts with "title" and "description" keys
+
+    Returns:
+        One category assignment per product, in input order
+    """
+    results = []
+    uncategorized = 0
+    for product in products:
+        text = _extract_terms(product["title"], product["description"])[0]
+        hits = _count_term_hits(text)
+        if not hits:
+            uncategorized += 1
+            results.append({
+                "category_id": None,
+                "category_name": "Uncategorized",
+                "confidence": 0.0,
+                "error": "No matching categories in taxonomy",
+            })
+            continue
+
+        # (score, position, total matches); the sort is stable, as in score_categories
+        strong = [hit for hit in hits if hit[1] + hit[2] >= 2] or hits
+        ranked = sorted(
+            ((kw * 1.0 + sig * 2.0, position, kw + sig) for position, kw, sig in strong),
+            key=itemgetter(0),
+            reverse=True,
+        )
+        confidence, _ = _gap_confidence([score for score, _, _ in ranked[:2]])
+        _, position, total_matches = ranked[0]
+        results.append({
+            "category_id": SUB_IDS[position],
+            "category_name": SUB_DISPLAY[SUB_IDS[position]],
+            "confidence": round(confidence, 2),
+            "reason": f"Best match with {total_matches} signals",
+        })
+
+    attach_reasoning({
+        "method": "batch_keyword_scoring",
+        "products": len(products),
+        "categorized": len(products) - uncategorized,
+    })
+
+    return results
@@ -16,43 +16,89 @@ Quick Start:
         return [c for c in candidates if c["score"] > 0.5]
 """
 
-# Public client API
-from .client import (
-    XRayClient,
-    current_run,
-    current_step,
-    get_client,
-    init_xray,
-    shutdown_xray,
-)
+from __future__ import annotations
 
-# Configuration
-from .config import XRayConfig, load_config
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> module defining it. Modules are imported on first attribute
+# access (PEP 562), so `from sdk import XRayConfig` doesn't load httpx and
+# `from sdk import step` doesn't need starlette.
+_EXPORTS: dict[str, str] = {
+    # Public client API
+    "XRayClient": ".client",
+    "current_run": ".client",
+    "current_step": ".client",
+    "get_client": ".client",
+    "init_xray": ".client",
+    "shutdown_xray": ".client",
+    # Configuration
+    "XRayConfig": ".config",
+    "load_config": ".config",
+    # Public decorators and helpers
+    "attach_candidates": ".decorators",
+    "attach_reasoning": ".decorators",
+    "instrument_class": ".decorators",
+    "step": ".decorators",
+    # Middleware
+    "XRayMiddleware": ".middleware",
+    # Internal classes exposed for type hints and advanced usage
+    "LARGE_LIST_THRESHOLD": "._internal.step",
+    "LARGE_STRING_THRESHOLD": "._internal.step",
+    "PREVIEW_SIZE": "._internal.step",
+    "STRING_PREVIEW_SIZE": "._internal.step",
+    "PayloadCollector": "._internal.step",
+    "Run": "._internal.run",
+    "Step": "._internal.step",
+    "Transport": "._internal.transport",
+    "infer_count": "._internal.step",
+    "summarize_payload": "._internal.step",
+}
+
+if TYPE_CHECKING:
+    from ._internal.run import Run
+    from ._internal.step import (
+        LARGE_LIST_THRESHOLD,
+        LARGE_STRING_THRESHOLD,
+        PREVIEW_SIZE,
+        STRING_PREVIEW_SIZE,
+        PayloadCollector,
+        Step,
+        infer_count,
+        summarize_payload,
+    )
+    from ._internal.transport import Transport
+    from .client import (
+        XRayClient,
+        current_run,
+        current_step,
+        get_client,
+        init_xray,
+        shutdown_xray,
+    )
+    from .config import XRayConfig, load_config
+    from .decorators import (
+        attach_candidates,
+        attach_reasoning,
+        instrument_class,
+        step,
+    )
+    from .middleware import XRayMiddleware
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining a public name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
 
-# Public decorators and helpers
-from .decorators import (
-    attach_candidates,
-    attach_reasoning,
-    instrument_class,
-    step,
-)
 
-# Middleware
-from .middleware import XRayMiddleware
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-# Internal classes exposed for type hints and advanced usage
-from ._internal import (
-    LARGE_LIST_THRESHOLD,
-    LARGE_STRING_THRESHOLD,
-    PREVIEW_SIZE,
-    STRING_PREVIEW_SIZE,
-    PayloadCollector,
-    Run,
-    Step,
-    Transport,
-    infer_count,
-    summarize_payload,
-)
 
 __all__ = [
     # Client and context management
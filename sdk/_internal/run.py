@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from shared.types import RunStatus, StepType
 
-from .step import PayloadCollector, Step, summarize_payload
+from .step import PayloadCollector, Step, _new_id, summarize_payload
 from .transport import Transport
 
+# Value -> member map for coercing status strings (see _STEP_STATUSES in step.py)
+_RUN_STATUSES: dict[str, RunStatus] = {member.value: member for member in RunStatus}
+
 
 class Run:
     """Represents a complete pipeline execution.
@@ -38,7 +40,7 @@ class Run:
             input_data: Optional pipeline input to summarize
             metadata: Optional metadata (request_id, user_id, environment, etc.)
         """
-        self._id = str(uuid.uuid4())
+        self._id = _new_id()
         self._transport = transport
         self._pipeline_name = pipeline_name
         self._metadata = metadata or {}
@@ -172,8 +174,9 @@ class Run:
             output: Final pipeline output
             status: Final status (success or error)
         """
-        final_status = RunStatus(status) if isinstance(status, str) else status
-        self._finalize_run(status=final_status, output=output)
+        if isinstance(status, str):
+            status = _RUN_STATUSES.get(status) or RunStatus(status)
+        self._finalize_run(status=status, output=output)
 
     def end_with_error(self, error: BaseException | str, output: Any = None) -> None:
         """End the run with an error.
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import time
-import uuid
-from datetime import datetime, timezone
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from shared.types import StepStatus, StepType
@@ -26,6 +26,30 @@ STRING_PREVIEW_SIZE = 100  # Chars to show in preview for large strings
 
 # Common ID field names to check
 ID_FIELDS = ("id", "_id", "candidate_id", "item_id", "product_id", "doc_id")
+_ID_FIELD_SET = frozenset(ID_FIELDS)
+
+# Value -> member maps for coercing strings to enums with one dict lookup
+# instead of a call through the Enum metaclass. Members hash and compare like
+# their values, so passing a member also hits. Unknown values still go through
+# the Enum constructor, which raises ValueError.
+_STEP_TYPES: dict[str, StepType] = {member.value: member for member in StepType}
+_STEP_STATUSES: dict[str, StepStatus] = {member.value: member for member in StepStatus}
+
+# Candidate score and reason field names, in priority order
+SCORE_FIELDS = ("score", "rank", "relevance", "confidence", "weight")
+REASON_FIELDS = ("reason", "explanation", "rationale", "why", "filter_reason")
+
+# Exact builtin types for the type() fast paths (subclasses use isinstance)
+_COLLECTION_TYPES = frozenset({list, tuple, set, frozenset})
+_UNCOUNTED_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+_INLINE_TYPES = frozenset({type(None), bool, int, float})  # Kept as raw values in containers
+_NESTED_TYPES = frozenset({str, list, tuple, set, frozenset, dict})  # Summarized in dicts
+
+# "_type" names of builtin types. For static (C) types, type.__name__ builds a
+# new string on every access, so summaries reuse these shared ones instead.
+_TYPE_NAMES: dict[type, str] = {
+    t: t.__name__ for t in (bool, int, float, str, bytes, list, tuple, set, frozenset, dict)
+}
 
 
 class PayloadCollector:
@@ -35,6 +59,8 @@ class PayloadCollector:
     and replaced with references in the summary.
     """
 
+    __slots__ = ("_payloads", "_counter")
+
     def __init__(self) -> None:
         """Initialize an empty payload collector."""
         self._payloads: dict[str, Any] = {}
@@ -72,7 +98,14 @@ def infer_count(obj: Any) -> int | None:
     Returns:
         Integer count for list-like objects, None otherwise
     """
-    if obj is None:
+    # Exact builtin types are dispatched by identity; subclasses and other
+    # objects fall through to the isinstance checks below.
+    obj_type = type(obj)
+    if obj_type in _COLLECTION_TYPES:
+        return len(obj)
+    if obj_type is dict:
+        return _infer_dict_count(obj)
+    if obj_type in _UNCOUNTED_TYPES:
         return None
 
     # Check for list, tuple, set, frozenset
@@ -81,16 +114,9 @@ def infer_count(obj: Any) -> int | None:
 
     # Check for dict with explicit "items" or "results" key
     if isinstance(obj, dict):
-        for key in ("items", "results", "data", "records", "candidates"):
-            if key in obj and isinstance(obj[key], (list, tuple)):
-                return len(obj[key])
-
-        # Handle decorator pattern: {"args": (list_arg,), "kwargs": {...}}
-        # If first positional arg is a list-like, use its count
-        if "args" in obj and isinstance(obj["args"], tuple) and len(obj["args"]) > 0:
-            first_arg = obj["args"][0]
-            if isinstance(first_arg, (list, tuple, set, frozenset)):
-                return len(first_arg)
+        count = _infer_dict_count(obj)
+        if count is not None:
+            return count
 
     # Check for __len__ on iterables (but not strings/dicts)
     if hasattr(obj, "__len__") and not isinstance(obj, (str, bytes, dict)):
@@ -102,6 +128,22 @@ def infer_count(obj: Any) -> int | None:
     return None
 
 
+def _infer_dict_count(obj: dict[Any, Any]) -> int | None:
+    """Infer item count from a dict's well-known list keys or decorator args."""
+    for key in ("items", "results", "data", "records", "candidates"):
+        if key in obj and isinstance(obj[key], (list, tuple)):
+            return len(obj[key])
+
+    # Handle decorator pattern: {"args": (list_arg,), "kwargs": {...}}
+    # If first positional arg is a list-like, use its count
+    if "args" in obj and isinstance(obj["args"], tuple) and len(obj["args"]) > 0:
+        first_arg = obj["args"][0]
+        if isinstance(first_arg, (list, tuple, set, frozenset)):
+            return len(first_arg)
+
+    return None
+
+
 def is_candidate_list(obj: Any) -> bool:
     """Check if object is a list of candidate-like dicts.
 
@@ -114,7 +156,8 @@ def is_candidate_list(obj: Any) -> bool:
     Returns:
         True if obj is a list where every item is a dict with an ID field
     """
-    if not isinstance(obj, (list, tuple)):
+    obj_type = type(obj)
+    if obj_type is not list and obj_type is not tuple and not isinstance(obj, (list, tuple)):
         return False
 
     if len(obj) == 0:
@@ -122,10 +165,10 @@ def is_candidate_list(obj: Any) -> bool:
 
     # Check ALL items to ensure correctness (heterogeneous lists should not be treated as candidates)
     for item in obj:
-        if not isinstance(item, dict):
+        if type(item) is not dict and not isinstance(item, dict):
             return False
         # Check if any ID field exists
-        if not any(field in item for field in ID_FIELDS):
+        if _ID_FIELD_SET.isdisjoint(item):
             return False
 
     return True
@@ -140,6 +183,16 @@ def extract_candidate(item: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dict with id, score, and reason (all always present for consistency)
     """
+    # Fast path for the common schema: "id" plus "score"/"reason" are each
+    # the first choice, so they're read directly and the loops only run for
+    # fields that are missing.
+    if "id" in item:
+        return {
+            "id": item["id"],
+            "score": item["score"] if "score" in item else _first_field(item, SCORE_FIELDS),
+            "reason": item["reason"] if "reason" in item else _first_field(item, REASON_FIELDS),
+        }
+
     result: dict[str, Any] = {}
 
     # Extract ID (try common field names)
@@ -148,28 +201,56 @@ def extract_candidate(item: dict[str, Any]) -> dict[str, Any]:
             result["id"] = item[field]
             break
 
-    # Extract score if present, default to None for consistent structure
-    result["score"] = None
-    for field in ("score", "rank", "relevance", "confidence", "weight"):
-        if field in item:
-            result["score"] = item[field]
-            break
+    # Extract score and reason if present, default to None for consistent structure
+    result["score"] = _first_field(item, SCORE_FIELDS)
+    result["reason"] = _first_field(item, REASON_FIELDS)
+
+    return result
 
-    # Extract reason if present, default to None for consistent structure
-    result["reason"] = None
-    for field in ("reason", "explanation", "rationale", "why", "filter_reason"):
+
+def _first_field(item: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the value of the first of fields present in item, or None."""
+    for field in fields:
         if field in item:
-            result["reason"] = item[field]
-            break
+            return item[field]
+    return None
 
-    return result
 
+def _format_iso_utc(timestamp_ns: int) -> str:
+    """Format epoch nanoseconds like datetime.isoformat() for a UTC datetime.
+
+    The date and time up to the second is formatted once per distinct second
+    and reused, which makes this about twice as fast as building a datetime.
+    """
+    global _iso_second
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    cached_seconds, prefix = _iso_second
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second = (seconds, prefix)
+    micros = remainder // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    # Like isoformat(), whole seconds carry no fractional part
+    return f"{prefix}+00:00"
+
+
+# Last (epoch second, formatted prefix) pair used by _format_iso_utc
+_iso_second: tuple[int, str] = (-1, "")
 
-def _truncate_string(s: str, max_length: int = MAX_STRING_LENGTH) -> str:
-    """Truncate a string if it exceeds max length."""
-    if len(s) <= max_length:
-        return s
-    return s[:max_length] + "..."
+# RFC 4122 variant nibble (10xx) for each hex digit of a random nibble
+_UUID_VARIANT = "89ab" * 4
+
+
+def _new_id() -> str:
+    """Return a random version 4 UUID string, like str(uuid.uuid4()).
+
+    Formats the random bytes directly; building a uuid.UUID object first
+    makes str(uuid.uuid4()) several times slower, and runs and steps each
+    need one.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[int(h[16], 16)]}{h[17:20]}-{h[20:]}"
 
 
 def summarize_payload(
@@ -191,46 +272,97 @@ def summarize_payload(
     """
     # Base case: max depth reached
     if depth >= MAX_PAYLOAD_DEPTH:
-        return {"_type": type(obj).__name__, "_truncated": True}
+        return {"_type": _type_name(type(obj)), "_truncated": True}
 
-    # Handle None
+    # Scalars (common for run and step inputs) are answered inline. Each call
+    # still gets a fresh dict since callers may hold on to or modify summaries.
+    obj_type = type(obj)
     if obj is None:
         return {"_type": "null", "_value": None}
-
-    # Handle bool (must check before int since bool is subclass of int)
-    if isinstance(obj, bool):
+    if obj_type is bool:
         return {"_type": "bool", "_value": obj}
+    if obj_type is int:
+        return {"_type": "int", "_value": obj}
 
-    # Handle numbers
-    if isinstance(obj, (int, float)):
-        return {"_type": type(obj).__name__, "_value": obj}
+    summarizer = _SUMMARIZERS.get(obj_type)
+    if summarizer is None:
+        summarizer = _summarizer_for(obj)
+    return summarizer(obj, depth, collector)
 
-    # Handle strings
+
+def _summarizer_for(obj: Any) -> _Summarizer:
+    """Pick the summarizer for a type not in _SUMMARIZERS (subclasses, objects)."""
+    # bool must be checked before int since bool is subclass of int
+    if isinstance(obj, bool):
+        return _summarize_bool
+    if isinstance(obj, (int, float)):
+        return _summarize_number
     if isinstance(obj, str):
-        length = len(obj)
-        # Large string (>1KB): externalize with preview if collector available
-        # This ensures no data loss for strings that would otherwise be truncated
-        if length > MAX_STRING_LENGTH and collector is not None:
-            ref_id = collector.add(obj)
-            return {
-                "_type": "str",
-                "_length": length,
-                "_ref": ref_id,
-                "_preview": obj[:STRING_PREVIEW_SIZE],
-            }
-        # Small string or no collector: store full or truncated value
-        truncated = length > MAX_STRING_LENGTH
+        return _summarize_str
+    if isinstance(obj, bytes):
+        return _summarize_bytes
+    if isinstance(obj, (list, tuple)):
+        return _summarize_sequence
+    if isinstance(obj, (set, frozenset)):
+        return _summarize_collection
+    if isinstance(obj, dict):
+        return _summarize_dict
+    return _summarize_object
+
+
+def _type_name(obj_type: type) -> str:
+    """Return the "_type" name for a type, shared for builtin types."""
+    return _TYPE_NAMES.get(obj_type) or obj_type.__name__
+
+
+def _is_inline(value: Any) -> bool:
+    """Return True for values stored as-is inside lists and dicts."""
+    return type(value) in _INLINE_TYPES or isinstance(value, (int, float))
+
+
+def _summarize_none(obj: None, depth: int, collector: PayloadCollector | None) -> dict[str, Any]:
+    return {"_type": "null", "_value": None}
+
+
+def _summarize_bool(obj: bool, depth: int, collector: PayloadCollector | None) -> dict[str, Any]:
+    return {"_type": "bool", "_value": obj}
+
+
+def _summarize_number(
+    obj: float, depth: int, collector: PayloadCollector | None
+) -> dict[str, Any]:
+    return {"_type": _type_name(type(obj)), "_value": obj}
+
+
+def _summarize_str(obj: str, depth: int, collector: PayloadCollector | None) -> dict[str, Any]:
+    length = len(obj)
+    # Large string (>1KB): externalize with preview if collector available
+    # This ensures no data loss for strings that would otherwise be truncated
+    if length > MAX_STRING_LENGTH and collector is not None:
+        ref_id = collector.add(obj)
         return {
             "_type": "str",
             "_length": length,
-            "_value": _truncate_string(obj),
-            "_truncated": truncated,
+            "_ref": ref_id,
+            "_preview": obj[:STRING_PREVIEW_SIZE],
         }
+    # Small string or no collector: store full or truncated value
+    truncated = length > MAX_STRING_LENGTH
+    return {
+        "_type": "str",
+        "_length": length,
+        "_value": obj[:MAX_STRING_LENGTH] + "..." if truncated else obj,
+        "_truncated": truncated,
+    }
 
-    # Handle bytes
-    if isinstance(obj, bytes):
-        return {"_type": "bytes", "_length": len(obj)}
 
+def _summarize_bytes(obj: bytes, depth: int, collector: PayloadCollector | None) -> dict[str, Any]:
+    return {"_type": "bytes", "_length": len(obj)}
+
+
+def _summarize_sequence(
+    obj: list[Any] | tuple[Any, ...], depth: int, collector: PayloadCollector | None
+) -> dict[str, Any]:
     # Handle candidate lists specially - extract ALL ids (always inline)
     if is_candidate_list(obj):
         candidates = [extract_candidate(item) for item in obj]
@@ -239,86 +371,96 @@ def summarize_payload(
             "_count": len(obj),
             "_candidates": candidates,
         }
+    return _summarize_collection(obj, depth, collector)
 
-    # Handle other lists/tuples/sets
-    if isinstance(obj, (list, tuple, set, frozenset)):
-        items = list(obj)
-        count = len(items)
 
-        # Determine item type
-        item_type = type(items[0]).__name__ if count > 0 else None
-
-        # Helper to summarize list items - primitives stay as-is, complex types get summarized
-        def summarize_item(item: Any) -> Any:
-            if item is None or isinstance(item, (bool, int, float)):
-                return item
-            else:
-                # Recursively summarize complex items (including strings)
-                # This ensures consistent externalization for large strings
-                return summarize_payload(item, depth + 1, collector)
-
-        # Large list: externalize with preview
-        if count >= LARGE_LIST_THRESHOLD and collector is not None:
-            ref_id = collector.add(items)
-            # Summarize preview items for safety
-            preview = [summarize_item(item) for item in items[:PREVIEW_SIZE]]
-            result: dict[str, Any] = {
-                "_type": "list",
-                "_count": count,
-                "_ref": ref_id,
-                "_preview": preview,
-            }
-            if item_type:
-                result["_item_type"] = item_type
-            return result
-
-        # Small list: store ALL values inline, summarizing complex items
-        summarized_values = [summarize_item(item) for item in items]
-        result = {
+def _summarize_collection(
+    obj: Any, depth: int, collector: PayloadCollector | None
+) -> dict[str, Any]:
+    count = len(obj)
+
+    # Determine item type (from the first item, without copying the collection)
+    item_type = _type_name(type(next(iter(obj)))) if count > 0 else None
+
+    # Helper to summarize list items - primitives stay as-is, complex types get summarized
+    def summarize_item(item: Any) -> Any:
+        if _is_inline(item):
+            return item
+        # Recursively summarize complex items (including strings)
+        # This ensures consistent externalization for large strings
+        return summarize_payload(item, depth + 1, collector)
+
+    # Large list: externalize with preview
+    if count >= LARGE_LIST_THRESHOLD and collector is not None:
+        # The collector keeps a snapshot, since the event is sent later
+        items = list(obj)
+        ref_id = collector.add(items)
+        # Summarize preview items for safety
+        preview = [summarize_item(item) for item in items[:PREVIEW_SIZE]]
+        result: dict[str, Any] = {
             "_type": "list",
             "_count": count,
-            "_values": summarized_values,
+            "_ref": ref_id,
+            "_preview": preview,
         }
         if item_type:
             result["_item_type"] = item_type
         return result
 
-    # Handle dicts - recursive summarization
-    if isinstance(obj, dict):
-        keys = list(obj.keys())[:MAX_DICT_KEYS]
-        result = {
-            "_type": "dict",
-            "_key_count": len(obj),
-            "_keys": [str(k) for k in keys],
-        }
-        if len(obj) > MAX_DICT_KEYS:
-            result["_keys_truncated"] = True
-
-        # Recursively summarize values
-        values: dict[str, Any] = {}
-        for k in keys:
-            v = obj[k]
-            if v is None:
-                values[str(k)] = None
-            elif isinstance(v, bool):
-                values[str(k)] = v
-            elif isinstance(v, (int, float)):
-                values[str(k)] = v
-            elif isinstance(v, str):
-                # For strings in dicts, use recursive summarize
-                values[str(k)] = summarize_payload(v, depth + 1, collector)
-            elif isinstance(v, (list, tuple, set, frozenset, dict)):
-                # Recursively summarize complex nested values
-                values[str(k)] = summarize_payload(v, depth + 1, collector)
-            else:
-                # For other complex types, just note the type
-                values[str(k)] = {"_type": type(v).__name__}
-        result["_values"] = values
-        return result
+    # Small list: store ALL values inline, summarizing complex items
+    summarized_values = [summarize_item(item) for item in obj]
+    result = {
+        "_type": "list",
+        "_count": count,
+        "_values": summarized_values,
+    }
+    if item_type:
+        result["_item_type"] = item_type
+    return result
+
 
-    # Handle other objects
+def _summarize_dict(
+    obj: dict[Any, Any], depth: int, collector: PayloadCollector | None
+) -> dict[str, Any]:
+    keys = list(obj.keys())[:MAX_DICT_KEYS]
+    result: dict[str, Any] = {
+        "_type": "dict",
+        "_key_count": len(obj),
+        "_keys": [str(k) for k in keys],
+    }
+    if len(obj) > MAX_DICT_KEYS:
+        result["_keys_truncated"] = True
+
+    # Recursively summarize values. Exact builtin types are matched first, by
+    # type identity; strings (the common value in wide, flat dicts) go straight
+    # to their summarizer when within the depth limit.
+    values: dict[str, Any] = {}
+    child_depth = depth + 1
+    str_direct = child_depth < MAX_PAYLOAD_DEPTH
+    for k in keys:
+        v = obj[k]
+        v_type = type(v)
+        if v_type in _INLINE_TYPES:
+            values[str(k)] = v
+        elif v_type is str and str_direct:
+            values[str(k)] = _summarize_str(v, child_depth, collector)
+        elif v_type in _NESTED_TYPES:
+            values[str(k)] = summarize_payload(v, child_depth, collector)
+        elif isinstance(v, (int, float)):
+            values[str(k)] = v
+        elif isinstance(v, (str, list, tuple, set, frozenset, dict)):
+            # Recursively summarize strings and complex nested values
+            values[str(k)] = summarize_payload(v, child_depth, collector)
+        else:
+            # For other complex types, just note the type
+            values[str(k)] = {"_type": type(v).__name__}
+    result["_values"] = values
+    return result
+
+
+def _summarize_object(obj: Any, depth: int, collector: PayloadCollector | None) -> dict[str, Any]:
     type_name = type(obj).__name__
-    result = {"_type": type_name}
+    result: dict[str, Any] = {"_type": type_name}
 
     # Try to get "id" attribute for identification
     if hasattr(obj, "id"):
@@ -331,6 +473,24 @@ def summarize_payload(
     return result
 
 
+_Summarizer = Callable[[Any, int, "PayloadCollector | None"], dict[str, Any]]
+
+# Summarizer per exact type, so common payloads skip the isinstance ladder
+_SUMMARIZERS: dict[type, _Summarizer] = {
+    type(None): _summarize_none,
+    bool: _summarize_bool,
+    int: _summarize_number,
+    float: _summarize_number,
+    str: _summarize_str,
+    bytes: _summarize_bytes,
+    list: _summarize_sequence,
+    tuple: _summarize_sequence,
+    set: _summarize_collection,
+    frozenset: _summarize_collection,
+    dict: _summarize_dict,
+}
+
+
 class Step:
     """Represents a single decision step within a Run.
 
@@ -343,6 +503,33 @@ class Step:
     and sends events to the transport layer.
     """
 
+    # One Step is created per pipeline step; slots keep instances small and
+    # attribute access fast
+    __slots__ = (
+        "_id",
+        "_run",
+        "_run_id",
+        "_transport",
+        "_send",
+        "_name",
+        "_step_type",
+        "_index",
+        "_metadata",
+        "_reasoning",
+        "_started_at_ns",
+        "_start_time_ns",
+        "_ended_at_ns",
+        "_duration_ms",
+        "_input_collector",
+        "_input_summary",
+        "_input_count",
+        "_output_summary",
+        "_output_payloads",
+        "_output_count",
+        "_status",
+        "_error_message",
+    )
+
     def __init__(
         self,
         run: Run,
@@ -364,25 +551,35 @@ class Step:
             index: Step index within run (0-based)
             metadata: Optional metadata dict
         """
-        self._id = str(uuid.uuid4())
+        self._id = _new_id()
         self._run = run
+        self._run_id = run.id  # Invariant; read by both events and run_id
         self._transport = transport
+        # Bound once; every step sends a start and an end event
+        self._send = transport.send
         self._name = name
-        self._step_type = StepType(step_type) if isinstance(step_type, str) else step_type
+        if isinstance(step_type, str):
+            step_type = _STEP_TYPES.get(step_type) or StepType(step_type)
+        self._step_type = step_type
         self._index = index
         self._metadata = metadata or {}
         self._reasoning: dict[str, Any] = {}
 
-        # Timing
-        self._started_at = datetime.now(timezone.utc)
+        # Timing: wall-clock nanoseconds for the event timestamps, the
+        # monotonic counter for the duration
+        self._started_at_ns = time.time_ns()
         self._start_time_ns = time.perf_counter_ns()
-        self._ended_at: datetime | None = None
+        self._ended_at_ns: int | None = None
         self._duration_ms: int | None = None
 
-        # Input processing - use collector for large data externalization
+        # Input processing - use collector for large data externalization.
+        # Skipped when the transport won't deliver events anyway.
         self._input_collector = PayloadCollector()
-        self._input_summary = summarize_payload(input_data, collector=self._input_collector)
-        self._input_count = infer_count(input_data)
+        self._input_summary: dict[str, Any] | None = None
+        self._input_count: int | None = None
+        if transport.is_collecting:
+            self._input_summary = summarize_payload(input_data, collector=self._input_collector)
+            self._input_count = infer_count(input_data)
 
         # Output (set on end)
         self._output_summary: dict[str, Any] | None = None
@@ -402,7 +599,7 @@ class Step:
     @property
     def run_id(self) -> str:
         """Parent run ID."""
-        return self._run.id
+        return self._run_id
 
     @property
     def name(self) -> str:
@@ -443,10 +640,10 @@ class Step:
             output: Optional output data
             error: Optional error (BaseException or string)
         """
-        if self._ended_at is not None:
+        if self._ended_at_ns is not None:
             return  # Already ended, idempotent
 
-        self._ended_at = datetime.now(timezone.utc)
+        self._ended_at_ns = time.time_ns()
         end_time_ns = time.perf_counter_ns()
         self._duration_ms = (end_time_ns - self._start_time_ns) // 1_000_000
 
@@ -458,7 +655,7 @@ class Step:
                 self._error_message = f"{type(error).__name__}: {error!s}"
             else:
                 self._error_message = str(error)
-        elif output is not None:
+        elif output is not None and self._transport.is_collecting:
             # Use collector for large data externalization
             output_collector = PayloadCollector()
             self._output_summary = summarize_payload(output, collector=output_collector)
@@ -478,8 +675,9 @@ class Step:
             output: Step output data (optional)
             status: Final status (success or error)
         """
-        final_status = StepStatus(status) if isinstance(status, str) else status
-        self._finalize_step(status=final_status, output=output)
+        if isinstance(status, str):
+            status = _STEP_STATUSES.get(status) or StepStatus(status)
+        self._finalize_step(status=status, output=output)
 
     def end_with_error(self, error: BaseException | str) -> None:
         """End the step with an error.
@@ -494,26 +692,28 @@ class Step:
         event = {
             "event_type": "step_start",
             "id": self._id,
-            "run_id": self._run.id,
+            "run_id": self._run_id,
             "step_name": self._name,
             "step_type": self._step_type.value,
             "index": self._index,
-            "started_at": self._started_at.isoformat(),
+            "started_at": _format_iso_utc(self._started_at_ns),
             "input_summary": self._input_summary,
             "input_count": self._input_count,
             "metadata": self._metadata if self._metadata else None,
             "_payloads": self._input_collector.get_payloads(),
         }
-        self._transport.send(event)
+        self._send(event)
 
     def _send_end_event(self) -> None:
         """Send step end event to transport."""
         event = {
             "event_type": "step_end",
             "id": self._id,
-            "run_id": self._run.id,
+            "run_id": self._run_id,
             "status": self._status.value,
-            "ended_at": self._ended_at.isoformat() if self._ended_at else None,
+            "ended_at": (
+                _format_iso_utc(self._ended_at_ns) if self._ended_at_ns is not None else None
+            ),
             "duration_ms": self._duration_ms,
             "output_summary": self._output_summary,
             "output_count": self._output_count,
@@ -521,4 +721,4 @@ class Step:
             "error_message": self._error_message,
             "_payloads": self._output_payloads,
         }
-        self._transport.send(event)
+        self._send(event)
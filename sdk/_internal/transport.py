@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import logging
-import queue
+from collections import deque
 from typing import Any
 
 import httpx
+from pydantic_core import to_json
 
 from ..config import XRayConfig
 
 logger = logging.getLogger(__name__)
 
+# Bodies smaller than this are sent uncompressed - gzip overhead outweighs the savings
+COMPRESS_MIN_BYTES = 1024
+
 
 class Transport:
     """Async buffered transport with fail-open semantics.
@@ -22,17 +27,19 @@ class Transport:
     Network errors are logged but never crash the application.
 
     Thread Safety:
-        Uses queue.Queue (thread-safe) for cross-thread event buffering.
-        The send() method can be safely called from any thread.
+        Uses a collections.deque for cross-thread event buffering; its
+        append() and popleft() are atomic, so send() can be safely called
+        from any thread.
     """
 
     def __init__(self, config: XRayConfig) -> None:
         self._config = config
-        # Use thread-safe queue.Queue for cross-thread communication
+        # deque append/popleft are atomic, so it is safe for cross-thread use
         # (send() called from main thread, worker runs in background thread)
-        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(
-            maxsize=config.buffer_size
-        )
+        # without queue.Queue's lock and condition bookkeeping on every send.
+        # No maxlen: a full buffer drops the new event, not the oldest one.
+        self._queue: deque[dict[str, Any]] = deque()
+        self._buffer_size = config.buffer_size
         self._client: httpx.AsyncClient | None = None
         self._worker_task: asyncio.Task[None] | None = None
         self._shutdown = asyncio.Event()
@@ -44,10 +51,19 @@ class Transport:
         """Check if transport is started."""
         return self._started
 
+    @property
+    def is_collecting(self) -> bool:
+        """Whether sent events will reach an API (started, with a base URL).
+
+        When False, events are dropped or discarded at flush, so callers can
+        skip the work of building their payload summaries.
+        """
+        return self._started and bool(self._config.base_url)
+
     @property
     def queue_size(self) -> int:
         """Current number of events in queue."""
-        return self._queue.qsize()
+        return len(self._queue)
 
     async def start(self) -> None:
         """Start the background worker."""
@@ -79,12 +95,13 @@ class Transport:
             logger.debug("Transport not started, dropping event")
             return False
 
-        try:
-            self._queue.put_nowait(event)
-            return True
-        except queue.Full:
+        # Concurrent senders may overshoot the limit by a few events; it only
+        # has to bound memory, not be exact
+        if len(self._queue) >= self._buffer_size:
             logger.warning("Event buffer full, dropping event")
             return False
+        self._queue.append(event)
+        return True
 
     async def _worker_loop(self) -> None:
         """Background worker that batches and flushes events."""
@@ -103,22 +120,25 @@ class Transport:
         """Collect events into a batch with timeout.
 
         Uses polling with asyncio.sleep to avoid blocking the event loop
-        while waiting for events from the thread-safe queue.
+        while waiting for events from the thread-safe deque.
         """
         batch: list[dict[str, Any]] = []
+        batch_size = self._batch_size
+        popleft = self._queue.popleft
         loop = asyncio.get_running_loop()
         deadline = loop.time() + self._config.flush_interval
 
-        while len(batch) < self._batch_size:
+        while len(batch) < batch_size:
             remaining = deadline - loop.time()
             if remaining <= 0:
                 break
 
             try:
-                # Non-blocking get from thread-safe queue
-                event = self._queue.get_nowait()
-                batch.append(event)
-            except queue.Empty:
+                # Drain everything already queued in one go (non-blocking pops
+                # from the thread-safe deque) before checking the clock again
+                while len(batch) < batch_size:
+                    batch.append(popleft())
+            except IndexError:
                 # No events available, sleep briefly then retry
                 # Use shorter sleep when we have events (to batch quickly)
                 # Use longer sleep when empty (to avoid busy-waiting)
@@ -137,7 +157,17 @@ class Transport:
             return
 
         try:
-            response = await self._client.post("/ingest", json=events)
+            # pydantic-core's encoder is several times faster than the stdlib
+            # json that httpx uses; NaN/Infinity are kept, as json.dumps does.
+            # Content-Type is already set on the client.
+            body = to_json(events, inf_nan_mode="constants")
+            headers = None
+            if self._config.compress and len(body) >= COMPRESS_MIN_BYTES:
+                # Level 1: event JSON is highly repetitive, so the fastest
+                # level already gets most of the size reduction
+                body = gzip.compress(body, compresslevel=1)
+                headers = {"Content-Encoding": "gzip"}
+            response = await self._client.post("/ingest", content=body, headers=headers)
             response.raise_for_status()
             logger.debug("Flushed %d events", len(events))
         except httpx.RequestError as e:
@@ -173,10 +203,10 @@ class Transport:
         self._started = False
 
         remaining: list[dict[str, Any]] = []
-        while not self._queue.empty():
+        while self._queue:
             try:
-                remaining.append(self._queue.get_nowait())
-            except queue.Empty:
+                remaining.append(self._queue.popleft())
+            except IndexError:
                 break
 
         if remaining:
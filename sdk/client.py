@@ -359,7 +359,7 @@ def current_step() -> Step | None:
 
     # Return last non-ended step (most recently started active step)
     for step in reversed(run._steps):
-        if step._ended_at is None:
+        if step._ended_at_ns is None:
             return step
 
     return None
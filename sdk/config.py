@@ -7,16 +7,21 @@ Environment variables take precedence over config file:
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
-
 from shared.config import find_config_file, get_section, load_yaml_file
 
 
-class XRayConfig(BaseModel):
-    """SDK configuration for X-Ray client."""
+@dataclass(slots=True, frozen=True)
+class XRayConfig:
+    """SDK configuration for X-Ray client.
+
+    A frozen, slotted dataclass: it is built once per process and only read
+    afterwards. Numeric fields accept strings (e.g. quoted YAML values);
+    values that cannot be coerced raise TypeError or ValueError.
+    """
 
     base_url: str | None = None
     api_key: str | None = None
@@ -24,6 +29,51 @@ class XRayConfig(BaseModel):
     flush_interval: float = 5.0
     batch_size: int = 100
     http_timeout: float = 30.0
+    # Gzip larger ingest batches. Opt-in: older API servers reject Content-Encoding: gzip
+    compress: bool = False
+
+    def __post_init__(self) -> None:
+        for name in ("base_url", "api_key"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, str):
+                raise TypeError(f"{name} must be a string, got {type(value).__name__}")
+        # Frozen, so coerced values are set through object.__setattr__
+        for name in ("buffer_size", "batch_size"):
+            object.__setattr__(self, name, _to_number(name, getattr(self, name), int))
+        for name in ("flush_interval", "http_timeout"):
+            object.__setattr__(self, name, _to_number(name, getattr(self, name), float))
+        object.__setattr__(self, "compress", _to_bool("compress", self.compress))
+
+
+def _to_number(name: str, value: Any, kind: type[int] | type[float]) -> Any:
+    """Coerce a config value to int or float, rejecting bools and lossy floats."""
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+    try:
+        number = kind(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if kind is int and isinstance(value, float) and number != value:
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+    return number
+
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_FALSY = frozenset({"false", "0", "no", "off"})
+
+
+def _to_bool(name: str, value: Any) -> bool:
+    """Coerce a config value to bool, so that e.g. "false" is not truthy."""
+    if isinstance(value, bool):
+        return value
+    text = value.strip().lower() if isinstance(value, str) else None
+    if text in _TRUTHY or text in _FALSY:
+        return text in _TRUTHY
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+
+# Keys of the `sdk:` section that map to XRayConfig fields; others are ignored
+_FIELD_NAMES = frozenset(f.name for f in fields(XRayConfig))
 
 
 def load_config(config_file: str | Path | None = None) -> XRayConfig:
@@ -37,7 +87,11 @@ def load_config(config_file: str | Path | None = None) -> XRayConfig:
         found_file = find_config_file()
         yaml_config = load_yaml_file(found_file) if found_file else {}
 
-    config: dict[str, Any] = get_section(yaml_config, "sdk")
+    config: dict[str, Any] = {
+        key: value
+        for key, value in get_section(yaml_config, "sdk").items()
+        if key in _FIELD_NAMES
+    }
 
     # Environment variables override config file
     if api_key := os.environ.get("XRAY_API_KEY"):
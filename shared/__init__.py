@@ -1,6 +1,12 @@
 """Shared types and utilities for X-Ray SDK and API."""
 
-from .config import CONFIG_FILENAME, find_config_file, get_section, load_yaml_file
+from .config import (
+    CONFIG_FILENAME,
+    clear_config_cache,
+    find_config_file,
+    get_section,
+    load_yaml_file,
+)
 from .types import DetailLevel, RunStatus, StepStatus, StepType
 
 __all__ = [
@@ -11,5 +17,6 @@ __all__ = [
     "CONFIG_FILENAME",
     "find_config_file",
     "load_yaml_file",
+    "clear_config_cache",
     "get_section",
 ]
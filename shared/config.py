@@ -5,35 +5,103 @@ Both SDK and API read from a single config file: `xray.config.yaml` in the proje
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-import yaml
-
 CONFIG_FILENAME = "xray.config.yaml"
 
 
 def find_config_file(start_path: Path | None = None) -> Path | None:
-    """Find xray.config.yaml by searching from start_path up to root."""
+    """Find xray.config.yaml by searching from start_path up to root.
+
+    A found file is memoized per start directory; use clear_config_cache() after
+    moving config files in a long-running process. Misses are not memoized, so a
+    config file created later is still found.
+    """
     current = Path(start_path) if start_path else Path.cwd()
+    try:
+        config_path = _find_config_file(current)
+        # A cached hit that has since been deleted falls back to a fresh walk
+        if not config_path.exists():
+            _find_config_file.cache_clear()
+            config_path = _find_config_file(current)
+    except FileNotFoundError:
+        return None
+
+    return config_path
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_file(current: Path) -> Path:
+    """Walk from current up to root looking for CONFIG_FILENAME.
 
+    Raises:
+        FileNotFoundError: If there is none - lru_cache doesn't cache exceptions,
+            so only hits are memoized
+    """
     for parent in [current, *current.parents]:
         config_path = parent / CONFIG_FILENAME
         if config_path.exists():
             return config_path
 
-    return None
+    raise FileNotFoundError(CONFIG_FILENAME)
 
 
 def load_yaml_file(config_file: str | Path) -> dict[str, Any]:
-    """Load configuration from a YAML file. Returns {} for non-dict content."""
+    """Load configuration from a YAML file. Returns {} for non-dict content.
+
+    Parsed content is cached by (resolved path, mtime, size), so repeated loads
+    of an unchanged file skip YAML parsing. Callers get a copy they are free to mutate.
+    """
     path = Path(config_file)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    try:
+        content = _parse_yaml_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    except OSError:  # Removed or made unreadable since the stat
         return {}
 
-    with open(path, encoding="utf-8") as f:
-        content = yaml.safe_load(f)
-        return content if isinstance(content, dict) else {}
+    return copy.deepcopy(content)
+
+
+@functools.cache
+def _yaml() -> tuple[ModuleType, type]:
+    """Import PyYAML on first use; return it with the fastest safe Loader.
+
+    Processes that never parse YAML (e.g. API workers reading a JSON sidecar)
+    don't pay for the import. CSafeLoader needs PyYAML built with libyaml.
+    """
+    import yaml
+
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file. mtime_ns and size are only part of the cache key.
+
+    Size catches rewrites within the filesystem's mtime granularity.
+    """
+    data = Path(path).read_bytes()
+    # Blank files (common while scaffolding) never reach PyYAML
+    if not data.strip():
+        return {}
+
+    yaml, loader = _yaml()
+    content = yaml.load(data, Loader=loader)
+    return content if isinstance(content, dict) else {}
+
+
+def clear_config_cache() -> None:
+    """Clear memoized config discovery and parsed YAML files."""
+    _find_config_file.cache_clear()
+    _parse_yaml_file.cache_clear()
 
 
 def get_section(config: dict[str, Any], section: str) -> dict[str, Any]:
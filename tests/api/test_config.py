@@ -1,8 +1,12 @@
 """Tests for API configuration."""
 
+import json
+import os
+import stat
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from api.config import APIConfig, load_config
 from shared.config import CONFIG_FILENAME
@@ -26,6 +30,12 @@ class TestAPIConfig:
         assert config.database_url == "sqlite+aiosqlite:///./test.db"
         assert config.debug is True
 
+    def test_is_immutable(self) -> None:
+        """Config cannot be modified after loading."""
+        config = APIConfig()
+        with pytest.raises(ValidationError):
+            config.debug = True
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -37,6 +47,14 @@ class TestLoadConfig:
         assert config.database_url == "postgresql+asyncpg://localhost:5432/xray"
         assert config.debug is False
 
+    def test_defaults_are_shared(self, tmp_path: Path, monkeypatch) -> None:
+        """Without a config file or env overrides, the same default instance is returned."""
+        monkeypatch.chdir(tmp_path)
+        for env_var in ("XRAY_DATABASE_URL", "XRAY_DEBUG", "XRAY_API_KEY"):
+            monkeypatch.delenv(env_var, raising=False)
+
+        assert load_config() is load_config()
+
     def test_loads_from_yaml_file(self, tmp_path: Path) -> None:
         """Config loads from explicit YAML file."""
         config_file = tmp_path / "test.yaml"
@@ -117,6 +135,135 @@ api:
         assert not hasattr(config, "base_url")
 
 
+class TestEnvOverrides:
+    """Tests for environment variable overrides."""
+
+    def test_debug_env_truthy_values(self, monkeypatch) -> None:
+        """XRAY_DEBUG accepts common truthy spellings."""
+        for value in ["true", "TRUE", "1", "yes", "on", " Yes "]:
+            monkeypatch.setenv("XRAY_DEBUG", value)
+            config = load_config(config_file="/nonexistent/path.yaml")
+            assert config.debug is True, f"Failed for value: {value}"
+
+    def test_debug_env_falsy_values(self, monkeypatch) -> None:
+        """Any other XRAY_DEBUG value disables debug mode."""
+        for value in ["false", "0", "no", "off", "enabled"]:
+            monkeypatch.setenv("XRAY_DEBUG", value)
+            config = load_config(config_file="/nonexistent/path.yaml")
+            assert config.debug is False, f"Failed for value: {value}"
+
+
+class TestConfigSidecar:
+    """Tests for the JSON sidecar cache of the discovered config file."""
+
+    def test_writes_sidecar_for_discovered_file(self, tmp_path: Path, monkeypatch) -> None:
+        """Loading a discovered config file writes a JSON sidecar next to it."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("api:\n  database_url: sqlite+aiosqlite:///./a.db")
+        monkeypatch.chdir(tmp_path)
+
+        load_config()
+
+        sidecar = json.loads((tmp_path / f"{CONFIG_FILENAME}.json").read_text())
+        assert sidecar["mtime_ns"] == config_file.stat().st_mtime_ns
+        assert sidecar["size"] == config_file.stat().st_size
+        assert sidecar["config"] == {"api": {"database_url": "sqlite+aiosqlite:///./a.db"}}
+
+    @pytest.mark.parametrize("mode", [0o600, 0o640])
+    def test_sidecar_gets_config_file_mode(
+        self, tmp_path: Path, monkeypatch, mode: int
+    ) -> None:
+        """The sidecar, which copies secrets like api_key, is no more readable than YAML."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("api:\n  api_key: s3cret")
+        config_file.chmod(mode)
+        monkeypatch.chdir(tmp_path)
+
+        load_config()
+
+        sidecar_file = tmp_path / f"{CONFIG_FILENAME}.json"
+        assert json.loads(sidecar_file.read_text())["config"] == {"api": {"api_key": "s3cret"}}
+        assert stat.S_IMODE(sidecar_file.stat().st_mode) == mode
+
+    def test_prefers_current_sidecar(self, tmp_path: Path, monkeypatch) -> None:
+        """A sidecar whose mtime and size match the YAML file is used instead of YAML."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("api:\n  database_url: sqlite+aiosqlite:///./yaml.db")
+        (tmp_path / f"{CONFIG_FILENAME}.json").write_text(
+            json.dumps(
+                {
+                    "mtime_ns": config_file.stat().st_mtime_ns,
+                    "size": config_file.stat().st_size,
+                    "config": {"api": {"database_url": "sqlite+aiosqlite:///./json.db"}},
+                }
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert load_config().database_url == "sqlite+aiosqlite:///./json.db"
+
+    def test_ignores_stale_sidecar(self, tmp_path: Path, monkeypatch) -> None:
+        """A sidecar recorded for an older YAML mtime is ignored and rewritten."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("api:\n  database_url: sqlite+aiosqlite:///./yaml.db")
+        sidecar_file = tmp_path / f"{CONFIG_FILENAME}.json"
+        sidecar_file.write_text(
+            json.dumps(
+                {
+                    "mtime_ns": config_file.stat().st_mtime_ns - 1,
+                    "config": {"api": {"database_url": "sqlite+aiosqlite:///./json.db"}},
+                }
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert load_config().database_url == "sqlite+aiosqlite:///./yaml.db"
+        assert json.loads(sidecar_file.read_text())["mtime_ns"] == config_file.stat().st_mtime_ns
+
+    def test_ignores_sidecar_after_same_mtime_rewrite(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """A YAML rewrite that keeps the mtime but changes the size is re-read."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("api:\n  database_url: sqlite+aiosqlite:///./a.db")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        monkeypatch.chdir(tmp_path)
+        assert load_config().database_url == "sqlite+aiosqlite:///./a.db"
+
+        config_file.write_text("api:\n  database_url: sqlite+aiosqlite:///./longer.db")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        assert load_config().database_url == "sqlite+aiosqlite:///./longer.db"
+
+    def test_sidecar_excludes_env_overrides(self, tmp_path: Path, monkeypatch) -> None:
+        """Env overrides are not written to the sidecar and stop applying once unset."""
+        yaml_url = "sqlite+aiosqlite:///./yaml.db"
+        (tmp_path / CONFIG_FILENAME).write_text(f"api:\n  database_url: {yaml_url}")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XRAY_DATABASE_URL", "postgresql://override")
+        monkeypatch.setenv("XRAY_API_KEY", "secret-from-env")
+
+        config = load_config()
+        assert config.database_url == "postgresql://override"
+        assert config.api_key == "secret-from-env"
+
+        sidecar = json.loads((tmp_path / f"{CONFIG_FILENAME}.json").read_text())
+        assert sidecar["config"] == {"api": {"database_url": yaml_url}}
+
+        monkeypatch.delenv("XRAY_DATABASE_URL")
+        monkeypatch.delenv("XRAY_API_KEY")
+        config = load_config()
+        assert config.database_url == yaml_url
+        assert config.api_key is None
+
+    def test_no_sidecar_in_debug_mode(self, tmp_path: Path, monkeypatch) -> None:
+        """No sidecar is written while debug mode is enabled."""
+        (tmp_path / CONFIG_FILENAME).write_text("api:\n  debug: true")
+        monkeypatch.chdir(tmp_path)
+
+        assert load_config().debug is True
+        assert not (tmp_path / f"{CONFIG_FILENAME}.json").exists()
+
+
 class TestConfigImports:
     """Tests for config module imports."""
 
@@ -7,6 +7,7 @@ import pytest
 from sqlalchemy import event, inspect, select, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
 
 from api.models import Base, Payload, Run, Step
 
@@ -18,13 +19,20 @@ def _enable_sqlite_fk(dbapi_conn, connection_record):
     cursor.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def engine():
-    """Create an in-memory SQLite engine for testing."""
+    """Create an in-memory SQLite engine for testing.
+
+    The schema is built once per module; the session fixture empties the
+    tables after each test.
+    """
     # Use SQLite for fast, isolated tests (actual app uses PostgreSQL)
+    # StaticPool: one connection for the engine's lifetime, so every session
+    # sees the same in-memory database
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
     )
     # Enable foreign key enforcement in SQLite
     event.listen(engine.sync_engine, "connect", _enable_sqlite_fk)
@@ -46,6 +54,11 @@ async def session(engine) -> AsyncSession:
     async with session_factory() as session:
         yield session
 
+    # Children first, so foreign keys are satisfied
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
 
 class TestRunModel:
     """Tests for Run model."""
@@ -1,19 +1,26 @@
 """Tests for API routes (/ingest endpoint)."""
 
-from uuid import uuid4
+import gzip
+import json
+from uuid import UUID, uuid4
 
 # Fixed timestamps for deterministic tests
 FIXED_START_TIME = "2024-01-15T10:00:00Z"
 FIXED_END_TIME = "2024-01-15T10:01:00Z"
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from api import routes
 from api._internal import store
 from api._internal.database import get_session
 from api.models import Base
+from api.routes import router
+from api.schemas import IngestResponse
 
 
 def _enable_sqlite_fk(dbapi_conn, connection_record):
@@ -23,12 +30,19 @@ def _enable_sqlite_fk(dbapi_conn, connection_record):
     cursor.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def engine():
-    """Create an in-memory SQLite engine for testing."""
+    """Create an in-memory SQLite engine for testing.
+
+    The schema is built once per module; the session fixture empties the
+    tables after each test.
+    """
+    # StaticPool: one connection for the engine's lifetime, so every session
+    # sees the same in-memory database
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
     )
     # Enable foreign key enforcement in SQLite
     event.listen(engine.sync_engine, "connect", _enable_sqlite_fk)
@@ -50,36 +64,50 @@ async def session(engine) -> AsyncSession:
     async with session_factory() as session:
         yield session
 
+    # Children first, so foreign keys are satisfied
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
-@pytest.fixture
-def client(engine, session):
-    """Create test client with overridden database dependency.
 
-    We create a minimal app without lifespan since we manage
-    the database manually in the test fixtures.
-    """
-    from fastapi import FastAPI
-    from api.routes import router
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Create a minimal app without lifespan (no init_db call).
 
-    # Create app without lifespan (no init_db call)
+    We manage the database manually in the test fixtures, so the app is built
+    once per module and only its session dependency is swapped per test.
+    """
     app = FastAPI()
     app.include_router(router)
+    return app
+
+
+@pytest.fixture
+async def client(app, session):
+    """Create test client with overridden database dependency.
+
+    Requests are dispatched in-process on the test's event loop, the same
+    one the session uses.
+    """
 
     async def override_get_session():
         yield session
 
     app.dependency_overrides[get_session] = override_get_session
 
-    with TestClient(app) as c:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
 
+    app.dependency_overrides.clear()
+
 
 class TestIngestEmpty:
     """Tests for empty batch handling."""
 
-    def test_ingest_empty_batch(self, client):
+    async def test_ingest_empty_batch(self, client):
         """Ingest with empty array returns success with zero counts."""
-        response = client.post("/ingest", json=[])
+        response = await client.post("/ingest", json=[])
         assert response.status_code == 200
         data = response.json()
         assert data["processed"] == 0
@@ -88,10 +116,51 @@ class TestIngestEmpty:
         assert data["results"] == []
 
 
+class TestIngestResponse:
+    """Tests for the pre-serialized /ingest response."""
+
+    async def test_response_matches_schema(self, client):
+        """The JSON body validates as IngestResponse."""
+        event = {
+            "event_type": "run_end",
+            "id": str(uuid4()),
+            "status": "success",
+            "ended_at": FIXED_END_TIME,
+        }
+        response = await client.post("/ingest", json=[event])
+        assert response.headers["content-type"] == "application/json"
+
+        body = IngestResponse.model_validate_json(response.content)
+        assert body.processed == 1
+        assert body.results[0].event_type == "run_end"
+        assert body.results[0].success is False
+
+    async def test_openapi_documents_response_model(self, client):
+        """OpenAPI still advertises IngestResponse for /ingest."""
+        schema = (await client.get("/openapi.json")).json()
+        response_schema = schema["paths"]["/ingest"]["post"]["responses"]["200"]
+        ref = response_schema["content"]["application/json"]["schema"]["$ref"]
+        assert ref.endswith("/IngestResponse")
+
+    async def test_openapi_documents_request_body(self, client):
+        """OpenAPI advertises the event list as the /ingest request body."""
+        schema = (await client.get("/openapi.json")).json()
+        request_body = schema["paths"]["/ingest"]["post"]["requestBody"]
+        assert request_body["required"] is True
+        body_schema = request_body["content"]["application/json"]["schema"]
+        assert body_schema["type"] == "array"
+        event_types = {
+            event["properties"]["event_type"]["const"] for event in body_schema["items"]["oneOf"]
+        }
+        assert event_types == {"run_start", "run_end", "step_start", "step_end"}
+        # No references into $defs, which would not resolve in the OpenAPI document
+        assert "$defs" not in json.dumps(request_body)
+
+
 class TestIngestRunStart:
     """Tests for run_start event ingestion."""
 
-    def test_ingest_run_start_minimal(self, client):
+    async def test_ingest_run_start_minimal(self, client):
         """Ingest run_start with only required fields."""
         event = {
             "event_type": "run_start",
@@ -100,14 +169,14 @@ class TestIngestRunStart:
             "status": "running",
             "started_at": FIXED_START_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         data = response.json()
         assert data["processed"] == 1
         assert data["succeeded"] == 1
         assert data["failed"] == 0
 
-    def test_ingest_run_start_full(self, client):
+    async def test_ingest_run_start_full(self, client):
         """Ingest run_start with all fields."""
         event = {
             "event_type": "run_start",
@@ -121,11 +190,11 @@ class TestIngestRunStart:
             "user_id": "user-456",
             "environment": "production",
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         assert response.json()["succeeded"] == 1
 
-    def test_ingest_run_start_with_payloads(self, client):
+    async def test_ingest_run_start_with_payloads(self, client):
         """Ingest run_start with externalized payloads."""
         event = {
             "event_type": "run_start",
@@ -138,7 +207,7 @@ class TestIngestRunStart:
                 "p-002": "x" * 2000,
             },
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         assert response.json()["succeeded"] == 1
 
@@ -146,11 +215,11 @@ class TestIngestRunStart:
 class TestIngestRunEnd:
     """Tests for run_end event ingestion."""
 
-    def test_ingest_run_end_success(self, client):
+    async def test_ingest_run_end_success(self, client):
         """Ingest run_end after run_start."""
         run_id = str(uuid4())
 
-        # First create the run
+        # Create the run and end it in one batch
         start_event = {
             "event_type": "run_start",
             "id": run_id,
@@ -158,9 +227,6 @@ class TestIngestRunEnd:
             "status": "running",
             "started_at": FIXED_START_TIME,
         }
-        client.post("/ingest", json=[start_event])
-
-        # Then end it
         end_event = {
             "event_type": "run_end",
             "id": run_id,
@@ -168,11 +234,14 @@ class TestIngestRunEnd:
             "ended_at": FIXED_END_TIME,
             "output_summary": {"result": "done"},
         }
-        response = client.post("/ingest", json=[end_event])
+        response = await client.post("/ingest", json=[start_event, end_event])
         assert response.status_code == 200
-        assert response.json()["succeeded"] == 1
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["results"][1]["event_type"] == "run_end"
+        assert data["results"][1]["success"]
 
-    def test_ingest_run_end_error(self, client):
+    async def test_ingest_run_end_error(self, client):
         """Ingest run_end with error status."""
         run_id = str(uuid4())
 
@@ -183,8 +252,6 @@ class TestIngestRunEnd:
             "status": "running",
             "started_at": FIXED_START_TIME,
         }
-        client.post("/ingest", json=[start_event])
-
         end_event = {
             "event_type": "run_end",
             "id": run_id,
@@ -192,11 +259,14 @@ class TestIngestRunEnd:
             "ended_at": FIXED_END_TIME,
             "error_message": "Something went wrong",
         }
-        response = client.post("/ingest", json=[end_event])
+        response = await client.post("/ingest", json=[start_event, end_event])
         assert response.status_code == 200
-        assert response.json()["succeeded"] == 1
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["results"][1]["event_type"] == "run_end"
+        assert data["results"][1]["success"]
 
-    def test_ingest_run_end_not_found(self, client):
+    async def test_ingest_run_end_not_found(self, client):
         """Ingest run_end for non-existent run returns failure."""
         event = {
             "event_type": "run_end",
@@ -204,7 +274,7 @@ class TestIngestRunEnd:
             "status": "success",
             "ended_at": FIXED_END_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         data = response.json()
         assert data["succeeded"] == 0
@@ -215,12 +285,12 @@ class TestIngestRunEnd:
 class TestIngestStepStart:
     """Tests for step_start event ingestion."""
 
-    def test_ingest_step_start(self, client):
+    async def test_ingest_step_start(self, client):
         """Ingest step_start after run_start."""
         run_id = str(uuid4())
         step_id = str(uuid4())
 
-        # Create run first
+        # Create the run and its step in one batch
         start_event = {
             "event_type": "run_start",
             "id": run_id,
@@ -228,9 +298,6 @@ class TestIngestStepStart:
             "status": "running",
             "started_at": FIXED_START_TIME,
         }
-        client.post("/ingest", json=[start_event])
-
-        # Create step
         step_event = {
             "event_type": "step_start",
             "id": step_id,
@@ -242,11 +309,14 @@ class TestIngestStepStart:
             "input_summary": {"items": 100},
             "input_count": 100,
         }
-        response = client.post("/ingest", json=[step_event])
+        response = await client.post("/ingest", json=[start_event, step_event])
         assert response.status_code == 200
-        assert response.json()["succeeded"] == 1
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["results"][1]["event_type"] == "step_start"
+        assert data["results"][1]["success"]
 
-    def test_ingest_step_start_orphan(self, client):
+    async def test_ingest_step_start_orphan(self, client):
         """Ingest step_start without parent run fails due to FK constraint."""
         event = {
             "event_type": "step_start",
@@ -257,7 +327,7 @@ class TestIngestStepStart:
             "index": 0,
             "started_at": FIXED_START_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         data = response.json()
         assert data["failed"] == 1
@@ -266,12 +336,12 @@ class TestIngestStepStart:
 class TestIngestStepEnd:
     """Tests for step_end event ingestion."""
 
-    def test_ingest_step_end_success(self, client):
+    async def test_ingest_step_end_success(self, client):
         """Ingest step_end after step_start."""
         run_id = str(uuid4())
         step_id = str(uuid4())
 
-        # Create run and step
+        # Create run and step, then end the step, in one batch
         events = [
             {
                 "event_type": "run_start",
@@ -290,9 +360,6 @@ class TestIngestStepEnd:
                 "started_at": FIXED_START_TIME,
             },
         ]
-        client.post("/ingest", json=events)
-
-        # End step
         end_event = {
             "event_type": "step_end",
             "id": step_id,
@@ -303,11 +370,14 @@ class TestIngestStepEnd:
             "output_summary": {"items": 50},
             "output_count": 50,
         }
-        response = client.post("/ingest", json=[end_event])
+        response = await client.post("/ingest", json=[*events, end_event])
         assert response.status_code == 200
-        assert response.json()["succeeded"] == 1
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["results"][2]["event_type"] == "step_end"
+        assert data["results"][2]["success"]
 
-    def test_ingest_step_end_with_reasoning(self, client):
+    async def test_ingest_step_end_with_reasoning(self, client):
         """Ingest step_end with reasoning attached."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -330,8 +400,6 @@ class TestIngestStepEnd:
                 "started_at": FIXED_START_TIME,
             },
         ]
-        client.post("/ingest", json=events)
-
         end_event = {
             "event_type": "step_end",
             "id": step_id,
@@ -343,11 +411,14 @@ class TestIngestStepEnd:
                 "top_scores": [0.95, 0.87, 0.72],
             },
         }
-        response = client.post("/ingest", json=[end_event])
+        response = await client.post("/ingest", json=[*events, end_event])
         assert response.status_code == 200
-        assert response.json()["succeeded"] == 1
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["results"][2]["event_type"] == "step_end"
+        assert data["results"][2]["success"]
 
-    def test_ingest_step_end_not_found(self, client):
+    async def test_ingest_step_end_not_found(self, client):
         """Ingest step_end for non-existent step returns failure."""
         event = {
             "event_type": "step_end",
@@ -356,7 +427,7 @@ class TestIngestStepEnd:
             "status": "success",
             "ended_at": FIXED_END_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         data = response.json()
         assert data["failed"] == 1
@@ -366,7 +437,7 @@ class TestIngestStepEnd:
 class TestIngestFullLifecycle:
     """Tests for complete run lifecycle ingestion."""
 
-    def test_ingest_full_lifecycle(self, client):
+    async def test_ingest_full_lifecycle(self, client):
         """Ingest complete run with multiple steps in single batch."""
         run_id = str(uuid4())
         step1_id = str(uuid4())
@@ -427,14 +498,14 @@ class TestIngestFullLifecycle:
             },
         ]
 
-        response = client.post("/ingest", json=events)
+        response = await client.post("/ingest", json=events)
         assert response.status_code == 200
         data = response.json()
         assert data["processed"] == 6
         assert data["succeeded"] == 6
         assert data["failed"] == 0
 
-    def test_ingest_partial_failure(self, client):
+    async def test_ingest_partial_failure(self, client):
         """Ingest batch with some valid and some invalid events."""
         run_id = str(uuid4())
 
@@ -464,7 +535,7 @@ class TestIngestFullLifecycle:
             },
         ]
 
-        response = client.post("/ingest", json=events)
+        response = await client.post("/ingest", json=events)
         assert response.status_code == 200
         data = response.json()
         assert data["processed"] == 3
@@ -472,24 +543,143 @@ class TestIngestFullLifecycle:
         assert data["failed"] == 1
 
         # Check individual results
-        assert data["results"][0]["success"] is True
-        assert data["results"][1]["success"] is False
-        assert data["results"][2]["success"] is True
+        assert [r["success"] for r in data["results"]] == [True, False, True]
+
+    async def test_results_follow_request_order(self, client):
+        """Results are reported in request order even though writes are grouped by type."""
+        run_id = str(uuid4())
+        step_id = str(uuid4())
+
+        events = [
+            {
+                "event_type": "run_start",
+                "id": run_id,
+                "pipeline_name": "test",
+                "status": "running",
+                "started_at": FIXED_START_TIME,
+            },
+            {
+                "event_type": "run_end",
+                "id": run_id,
+                "status": "success",
+                "ended_at": FIXED_END_TIME,
+            },
+            {
+                "event_type": "step_start",
+                "id": step_id,
+                "run_id": run_id,
+                "step_name": "late_step",
+                "step_type": "other",
+                "index": 0,
+                "started_at": FIXED_START_TIME,
+            },
+        ]
+
+        data = (await client.post("/ingest", json=events)).json()
+        assert data["succeeded"] == 3
+        assert [r["event_type"] for r in data["results"]] == [
+            "run_start",
+            "run_end",
+            "step_start",
+        ]
+
+    async def test_failed_bulk_write_isolates_bad_event(self, client):
+        """An orphan step in a batch fails alone; the other steps are still stored."""
+        run_id = str(uuid4())
+        good_step_ids = [str(uuid4()), str(uuid4())]
+        orphan_step_id = str(uuid4())
+
+        def step_start(step_id, parent_id, index):
+            return {
+                "event_type": "step_start",
+                "id": step_id,
+                "run_id": parent_id,
+                "step_name": f"step_{index}",
+                "step_type": "filter",
+                "index": index,
+                "started_at": FIXED_START_TIME,
+            }
+
+        events = [
+            {
+                "event_type": "run_start",
+                "id": run_id,
+                "pipeline_name": "test",
+                "status": "running",
+                "started_at": FIXED_START_TIME,
+            },
+            step_start(good_step_ids[0], run_id, 0),
+            step_start(orphan_step_id, str(uuid4()), 1),
+            step_start(good_step_ids[1], run_id, 2),
+        ]
+
+        data = (await client.post("/ingest", json=events)).json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 1
+        assert data["results"][2]["id"] == orphan_step_id
+        assert data["results"][2]["success"] is False
+
+        steps = (await client.get("/xray/steps", params={"run_id": run_id})).json()["steps"]
+        assert {s["id"] for s in steps} == set(good_step_ids)
+
+    async def test_end_fallback_reports_missing_targets(self, client, monkeypatch):
+        """When a bulk end write fails, retries still end existing runs and flag missing ones."""
+        run_id = str(uuid4())
+        missing_id = str(uuid4())
+
+        original_end_runs = store.end_runs
+        retried_with: list[object] = []
+
+        async def failing_end_runs(session, ends, runs=None):
+            if len(ends) > 1:
+                raise RuntimeError("bulk update failed")
+            retried_with.append(runs)
+            return await original_end_runs(session, ends, runs)
+
+        monkeypatch.setattr(store, "end_runs", failing_end_runs)
+
+        def run_end(id_):
+            return {
+                "event_type": "run_end",
+                "id": id_,
+                "status": "success",
+                "ended_at": FIXED_END_TIME,
+            }
+
+        events = [
+            {
+                "event_type": "run_start",
+                "id": run_id,
+                "pipeline_name": "test",
+                "status": "running",
+                "started_at": FIXED_START_TIME,
+            },
+            run_end(missing_id),
+            run_end(run_id),
+        ]
+
+        data = (await client.post("/ingest", json=events)).json()
+        assert [r["success"] for r in data["results"]] == [True, False, True]
+        assert data["results"][1]["error"] == f"Run {missing_id} not found"
+        assert (await client.get(f"/xray/runs/{run_id}")).json()["status"] == "success"
+        # Only the existing run is retried, with the prefetched runs instead of a new SELECT
+        assert len(retried_with) == 1
+        assert retried_with[0] is not None and UUID(run_id) in retried_with[0]
 
 
 class TestIngestValidation:
     """Tests for request validation."""
 
-    def test_ingest_invalid_event_type(self, client):
+    async def test_ingest_invalid_event_type(self, client):
         """Invalid event_type returns 422 validation error."""
         event = {
             "event_type": "invalid_type",
             "id": str(uuid4()),
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 422
 
-    def test_ingest_invalid_uuid(self, client):
+    async def test_ingest_invalid_uuid(self, client):
         """Invalid UUID format returns 422 validation error."""
         event = {
             "event_type": "run_start",
@@ -498,20 +688,20 @@ class TestIngestValidation:
             "status": "running",
             "started_at": FIXED_START_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 422
 
-    def test_ingest_missing_required_field(self, client):
+    async def test_ingest_missing_required_field(self, client):
         """Missing required field returns 422 validation error."""
         event = {
             "event_type": "run_start",
             "id": str(uuid4()),
             # Missing: pipeline_name, status, started_at
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 422
 
-    def test_ingest_invalid_status(self, client):
+    async def test_ingest_invalid_status(self, client):
         """Invalid status value returns 422 validation error."""
         event = {
             "event_type": "run_start",
@@ -520,8 +710,75 @@ class TestIngestValidation:
             "status": "invalid_status",  # Should be "running"
             "started_at": FIXED_START_TIME,
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
+        assert response.status_code == 422
+
+    async def test_ingest_error_locations_match_fastapi(self, client):
+        """Validation errors are reported under the body location like FastAPI's."""
+        response = await client.post("/ingest", json=[{"event_type": "run_start"}])
         assert response.status_code == 422
+        assert all(err["loc"][0] == "body" for err in response.json()["detail"])
+
+    async def test_ingest_malformed_json(self, client):
+        """A body that is not valid JSON returns 422."""
+        response = await client.post(
+            "/ingest", content=b"[{", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 422
+
+    async def test_ingest_gzip_body(self, client):
+        """A gzip-encoded body is decompressed before validation."""
+        event = {
+            "event_type": "run_start",
+            "id": str(uuid4()),
+            "pipeline_name": "test",
+            "status": "running",
+            "started_at": FIXED_START_TIME,
+        }
+        response = await client.post(
+            "/ingest",
+            content=gzip.compress(json.dumps([event]).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.json()["succeeded"] == 1
+
+    async def test_ingest_corrupt_gzip_body(self, client):
+        """A body that claims gzip but isn't returns 400."""
+        response = await client.post(
+            "/ingest",
+            content=b"[]",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    async def test_ingest_truncated_gzip_body(self, client):
+        """A gzip body cut off before its trailer returns 400."""
+        response = await client.post(
+            "/ingest",
+            content=gzip.compress(b"[]" * 100)[:-4],
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    async def test_ingest_gzip_body_over_limit(self, client, monkeypatch):
+        """A gzip body that inflates past the limit is rejected with 413."""
+        monkeypatch.setattr(routes, "MAX_DECOMPRESSED_BODY_BYTES", 1024)
+        response = await client.post(
+            "/ingest",
+            content=gzip.compress(b"[" + b" " * 2048 + b"]"),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 413
+
+    async def test_ingest_unsupported_encoding(self, client):
+        """Encodings other than gzip are rejected with 415."""
+        response = await client.post(
+            "/ingest",
+            content=b"[]",
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+        assert response.status_code == 415
 
 
 class TestIngestPayloads:
@@ -543,7 +800,7 @@ class TestIngestPayloads:
                 "p-002": {"nested": "data"},
             },
         }
-        response = client.post("/ingest", json=[event])
+        response = await client.post("/ingest", json=[event])
         assert response.status_code == 200
         assert response.json()["succeeded"] == 1
 
@@ -590,7 +847,7 @@ class TestIngestPayloads:
                 "_payloads": {"p-output": [4, 5, 6]},
             },
         ]
-        response = client.post("/ingest", json=events)
+        response = await client.post("/ingest", json=events)
         assert response.status_code == 200
         assert response.json()["succeeded"] == 3
 
@@ -606,6 +863,40 @@ class TestIngestPayloads:
         assert output_payload.ref_id == "p-output"
         assert output_payload.step_id == step_id
 
+    @pytest.mark.asyncio
+    async def test_payloads_from_many_events_in_one_batch(self, client, session):
+        """Payloads from every event in a batch are stored."""
+        run_ids = [uuid4() for _ in range(3)]
+        events = [
+            {
+                "event_type": "run_start",
+                "id": str(run_id),
+                "pipeline_name": "test",
+                "status": "running",
+                "started_at": FIXED_START_TIME,
+                "_payloads": {"p-in": [i]},
+            }
+            for i, run_id in enumerate(run_ids)
+        ] + [
+            {
+                "event_type": "run_end",
+                "id": str(run_id),
+                "status": "success",
+                "ended_at": FIXED_END_TIME,
+                "_payloads": {"p-out": [i]},
+            }
+            for i, run_id in enumerate(run_ids)
+        ]
+        response = await client.post("/ingest", json=events)
+        assert response.json()["succeeded"] == 6
+
+        for i, run_id in enumerate(run_ids):
+            payloads = await store.get_payloads(session, run_id=run_id)
+            assert {(p.phase, p.ref_id, tuple(p.data)) for p in payloads} == {
+                ("input", "p-in", (i,)),
+                ("output", "p-out", (i,)),
+            }
+
 
 # =============================================================================
 # Query Endpoint Tests
@@ -615,7 +906,7 @@ class TestIngestPayloads:
 class TestGetRunById:
     """Tests for GET /xray/runs/{id}."""
 
-    def test_get_run_returns_run_with_steps(self, client):
+    async def test_get_run_returns_run_with_steps(self, client):
         """GET /xray/runs/{id} returns run with steps ordered by start time."""
         run_id = str(uuid4())
         step1_id = str(uuid4())
@@ -649,9 +940,9 @@ class TestGetRunById:
                 "started_at": "2024-01-15T10:00:01Z",
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -662,14 +953,14 @@ class TestGetRunById:
         assert data["steps"][0]["step_name"] == "step_a"
         assert data["steps"][1]["step_name"] == "step_b"
 
-    def test_get_run_not_found(self, client):
+    async def test_get_run_not_found(self, client):
         """GET /xray/runs/{id} returns 404 for non-existent run."""
-        response = client.get(f"/xray/runs/{uuid4()}")
+        response = await client.get(f"/xray/runs/{uuid4()}")
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_run_steps_have_removed_ratio(self, client):
+    async def test_get_run_steps_have_removed_ratio(self, client):
         """GET /xray/runs/{id} includes computed removed_ratio for steps."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -701,9 +992,9 @@ class TestGetRunById:
                 "output_count": 10,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
@@ -711,7 +1002,7 @@ class TestGetRunById:
         assert step["output_count"] == 10
         assert step["removed_ratio"] == 0.9  # (100 - 10) / 100
 
-    def test_get_run_includes_all_fields(self, client):
+    async def test_get_run_includes_all_fields(self, client):
         """GET /xray/runs/{id} includes all run fields."""
         run_id = str(uuid4())
 
@@ -736,9 +1027,9 @@ class TestGetRunById:
                 "output_summary": {"result": "done"},
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -755,7 +1046,7 @@ class TestGetRunById:
 class TestListRuns:
     """Tests for GET /xray/runs."""
 
-    def test_list_runs_returns_all(self, client):
+    async def test_list_runs_returns_all(self, client):
         """GET /xray/runs returns all runs."""
         for i in range(3):
             event = {
@@ -765,16 +1056,16 @@ class TestListRuns:
                 "status": "running",
                 "started_at": FIXED_START_TIME,
             }
-            client.post("/ingest", json=[event])
+            await client.post("/ingest", json=[event])
 
-        response = client.get("/xray/runs")
+        response = await client.get("/xray/runs")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 3
         assert len(data["runs"]) == 3
 
-    def test_list_runs_filter_by_pipeline(self, client):
+    async def test_list_runs_filter_by_pipeline(self, client):
         """GET /xray/runs?pipeline=X filters by pipeline name."""
         for name in ["target", "other1", "other2"]:
             event = {
@@ -784,16 +1075,16 @@ class TestListRuns:
                 "status": "running",
                 "started_at": FIXED_START_TIME,
             }
-            client.post("/ingest", json=[event])
+            await client.post("/ingest", json=[event])
 
-        response = client.get("/xray/runs?pipeline=target")
+        response = await client.get("/xray/runs?pipeline=target")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
         assert data["runs"][0]["pipeline_name"] == "target"
 
-    def test_list_runs_filter_by_status(self, client):
+    async def test_list_runs_filter_by_status(self, client):
         """GET /xray/runs?status=X filters by status."""
         run_id = str(uuid4())
         events = [
@@ -811,10 +1102,10 @@ class TestListRuns:
                 "ended_at": FIXED_END_TIME,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
         # Create another running run
-        client.post(
+        await client.post(
             "/ingest",
             json=[
                 {
@@ -827,14 +1118,14 @@ class TestListRuns:
             ],
         )
 
-        response = client.get("/xray/runs?status=success")
+        response = await client.get("/xray/runs?status=success")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
         assert data["runs"][0]["status"] == "success"
 
-    def test_list_runs_filter_by_user_id(self, client):
+    async def test_list_runs_filter_by_user_id(self, client):
         """GET /xray/runs?user_id=X filters by user ID."""
         for user in ["user-123", "user-456"]:
             event = {
@@ -845,16 +1136,16 @@ class TestListRuns:
                 "started_at": FIXED_START_TIME,
                 "user_id": user,
             }
-            client.post("/ingest", json=[event])
+            await client.post("/ingest", json=[event])
 
-        response = client.get("/xray/runs?user_id=user-123")
+        response = await client.get("/xray/runs?user_id=user-123")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
         assert data["runs"][0]["user_id"] == "user-123"
 
-    def test_list_runs_pagination(self, client):
+    async def test_list_runs_pagination(self, client):
         """GET /xray/runs supports limit and offset pagination."""
         for i in range(5):
             event = {
@@ -864,9 +1155,9 @@ class TestListRuns:
                 "status": "running",
                 "started_at": FIXED_START_TIME,
             }
-            client.post("/ingest", json=[event])
+            await client.post("/ingest", json=[event])
 
-        response = client.get("/xray/runs?limit=2&offset=0")
+        response = await client.get("/xray/runs?limit=2&offset=0")
 
         assert response.status_code == 200
         data = response.json()
@@ -875,7 +1166,7 @@ class TestListRuns:
         assert data["limit"] == 2
         assert data["offset"] == 0
 
-    def test_list_runs_does_not_include_steps(self, client):
+    async def test_list_runs_does_not_include_steps(self, client):
         """GET /xray/runs does not include steps in response."""
         run_id = str(uuid4())
         events = [
@@ -896,17 +1187,17 @@ class TestListRuns:
                 "started_at": FIXED_START_TIME,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get("/xray/runs")
+        response = await client.get("/xray/runs")
 
         assert response.status_code == 200
         run = response.json()["runs"][0]
         assert "steps" not in run
 
-    def test_list_runs_empty(self, client):
+    async def test_list_runs_empty(self, client):
         """GET /xray/runs returns empty list when no runs exist."""
-        response = client.get("/xray/runs")
+        response = await client.get("/xray/runs")
 
         assert response.status_code == 200
         data = response.json()
@@ -917,10 +1208,10 @@ class TestListRuns:
 class TestListSteps:
     """Tests for GET /xray/steps."""
 
-    def test_list_steps_returns_all(self, client):
+    async def test_list_steps_returns_all(self, client):
         """GET /xray/steps returns all steps."""
         run_id = str(uuid4())
-        client.post(
+        await client.post(
             "/ingest",
             json=[
                 {
@@ -943,22 +1234,22 @@ class TestListSteps:
                 "index": i,
                 "started_at": FIXED_START_TIME,
             }
-            client.post("/ingest", json=[event])
+            await client.post("/ingest", json=[event])
 
-        response = client.get("/xray/steps")
+        response = await client.get("/xray/steps")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 3
         assert len(data["steps"]) == 3
 
-    def test_list_steps_filter_by_run_id(self, client):
+    async def test_list_steps_filter_by_run_id(self, client):
         """GET /xray/steps?run_id=X filters by run ID."""
         run1_id = str(uuid4())
         run2_id = str(uuid4())
 
         for run_id in [run1_id, run2_id]:
-            client.post(
+            await client.post(
                 "/ingest",
                 json=[
                     {
@@ -970,7 +1261,7 @@ class TestListSteps:
                     }
                 ],
             )
-            client.post(
+            await client.post(
                 "/ingest",
                 json=[
                     {
@@ -985,17 +1276,17 @@ class TestListSteps:
                 ],
             )
 
-        response = client.get(f"/xray/steps?run_id={run1_id}")
+        response = await client.get(f"/xray/steps?run_id={run1_id}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
         assert data["steps"][0]["run_id"] == run1_id
 
-    def test_list_steps_filter_by_type(self, client):
+    async def test_list_steps_filter_by_type(self, client):
         """GET /xray/steps?step_type=X filters by step type."""
         run_id = str(uuid4())
-        client.post(
+        await client.post(
             "/ingest",
             json=[
                 {
@@ -1009,7 +1300,7 @@ class TestListSteps:
         )
 
         for i, step_type in enumerate(["filter", "rank", "filter"]):
-            client.post(
+            await client.post(
                 "/ingest",
                 json=[
                     {
@@ -1024,14 +1315,14 @@ class TestListSteps:
                 ],
             )
 
-        response = client.get("/xray/steps?step_type=filter")
+        response = await client.get("/xray/steps?step_type=filter")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 2
         assert all(s["step_type"] == "filter" for s in data["steps"])
 
-    def test_list_steps_includes_removed_ratio(self, client):
+    async def test_list_steps_includes_removed_ratio(self, client):
         """GET /xray/steps includes computed removed_ratio."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1063,18 +1354,18 @@ class TestListSteps:
                 "output_count": 5,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get("/xray/steps")
+        response = await client.get("/xray/steps")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
         assert step["removed_ratio"] == 0.95  # (100 - 5) / 100
 
-    def test_list_steps_pagination(self, client):
+    async def test_list_steps_pagination(self, client):
         """GET /xray/steps supports pagination."""
         run_id = str(uuid4())
-        client.post(
+        await client.post(
             "/ingest",
             json=[
                 {
@@ -1088,7 +1379,7 @@ class TestListSteps:
         )
 
         for i in range(5):
-            client.post(
+            await client.post(
                 "/ingest",
                 json=[
                     {
@@ -1103,7 +1394,7 @@ class TestListSteps:
                 ],
             )
 
-        response = client.get("/xray/steps?limit=2&offset=1")
+        response = await client.get("/xray/steps?limit=2&offset=1")
 
         assert response.status_code == 200
         data = response.json()
@@ -1116,7 +1407,7 @@ class TestListSteps:
 class TestRemovedRatioEdgeCases:
     """Tests for removed_ratio computation edge cases."""
 
-    def test_removed_ratio_input_count_zero(self, client):
+    async def test_removed_ratio_input_count_zero(self, client):
         """removed_ratio is null when input_count is 0."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1148,15 +1439,15 @@ class TestRemovedRatioEdgeCases:
                 "output_count": 0,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
         assert step["removed_ratio"] is None  # Division by zero
 
-    def test_removed_ratio_input_count_none(self, client):
+    async def test_removed_ratio_input_count_none(self, client):
         """removed_ratio is null when input_count is None."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1188,15 +1479,15 @@ class TestRemovedRatioEdgeCases:
                 "output_count": 1,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
         assert step["removed_ratio"] is None
 
-    def test_removed_ratio_output_count_none(self, client):
+    async def test_removed_ratio_output_count_none(self, client):
         """removed_ratio is null when output_count is None."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1221,15 +1512,15 @@ class TestRemovedRatioEdgeCases:
             },
             # step_end not sent, so output_count remains None
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
         assert step["removed_ratio"] is None
 
-    def test_removed_ratio_negative_removal(self, client):
+    async def test_removed_ratio_negative_removal(self, client):
         """removed_ratio can be negative when output > input (expansion)."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1261,15 +1552,15 @@ class TestRemovedRatioEdgeCases:
                 "output_count": 50,  # Expanded from 10 to 50
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
         assert step["removed_ratio"] == -4.0  # (10 - 50) / 10 = -4.0
 
-    def test_removed_ratio_exact_zero(self, client):
+    async def test_removed_ratio_exact_zero(self, client):
         """removed_ratio is 0.0 when input equals output."""
         run_id = str(uuid4())
         step_id = str(uuid4())
@@ -1301,9 +1592,9 @@ class TestRemovedRatioEdgeCases:
                 "output_count": 50,
             },
         ]
-        client.post("/ingest", json=events)
+        await client.post("/ingest", json=events)
 
-        response = client.get(f"/xray/runs/{run_id}")
+        response = await client.get(f"/xray/runs/{run_id}")
 
         assert response.status_code == 200
         step = response.json()["steps"][0]
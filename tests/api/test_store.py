@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from api._internal import store
 from api.models import Base, Run, Step
@@ -18,12 +19,19 @@ def _enable_sqlite_fk(dbapi_conn, connection_record):
     cursor.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def engine():
-    """Create an in-memory SQLite engine for testing."""
+    """Create an in-memory SQLite engine for testing.
+
+    The schema is built once per module; the session fixture empties the
+    tables after each test.
+    """
+    # StaticPool: one connection for the engine's lifetime, so every session
+    # sees the same in-memory database
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
     )
     # Enable foreign key enforcement in SQLite
     event.listen(engine.sync_engine, "connect", _enable_sqlite_fk)
@@ -45,6 +53,11 @@ async def session(engine) -> AsyncSession:
     async with session_factory() as session:
         yield session
 
+    # Children first, so foreign keys are satisfied
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
 
 class TestCreateRun:
     """Tests for store.create_run()."""
@@ -335,6 +348,106 @@ class TestEndStep:
         assert result is None
 
 
+class TestBulkWrites:
+    """Tests for store.create_runs/create_steps/end_runs/end_steps()."""
+
+    async def test_create_runs_and_steps(self, session: AsyncSession) -> None:
+        """create_runs and create_steps insert every record."""
+        started = datetime.now(timezone.utc)
+        run_ids = [uuid4(), uuid4()]
+
+        runs = await store.create_runs(
+            session,
+            [
+                {"id": run_id, "pipeline_name": "bulk", "status": "running", "started_at": started}
+                for run_id in run_ids
+            ],
+        )
+        steps = await store.create_steps(
+            session,
+            [
+                {
+                    "id": uuid4(),
+                    "run_id": run_id,
+                    "step_name": "process",
+                    "step_type": "transform",
+                    "index": 0,
+                    "started_at": started,
+                    "metadata": {"k": "v"},
+                }
+                for run_id in run_ids
+            ],
+        )
+
+        assert [run.id for run in runs] == run_ids
+        assert [step.run_id for step in steps] == run_ids
+        assert all(step.metadata_ == {"k": "v"} for step in steps)
+        assert await store.count_runs(session, pipeline_name="bulk") == 2
+
+    async def test_end_runs_skips_missing(self, session: AsyncSession) -> None:
+        """end_runs updates existing runs and omits unknown IDs from the result."""
+        started = datetime.now(timezone.utc)
+        run_id = uuid4()
+        missing_id = uuid4()
+        await store.create_run(
+            session, id=run_id, pipeline_name="bulk", status="running", started_at=started
+        )
+
+        runs = await store.end_runs(
+            session,
+            [
+                {"id": run_id, "status": "success", "ended_at": started},
+                {"id": missing_id, "status": "success", "ended_at": started},
+            ],
+        )
+
+        assert set(runs) == {run_id}
+        assert runs[run_id].status == "success"
+
+    async def test_end_runs_uses_preloaded_runs(self, session: AsyncSession) -> None:
+        """end_runs updates the given runs in place instead of loading them again."""
+        started = datetime.now(timezone.utc)
+        run_id = uuid4()
+        await store.create_run(
+            session, id=run_id, pipeline_name="bulk", status="running", started_at=started
+        )
+        loaded = await store.get_runs(session, [run_id])
+
+        runs = await store.end_runs(
+            session, [{"id": run_id, "status": "success", "ended_at": started}], loaded
+        )
+
+        assert runs is loaded
+        assert loaded[run_id].status == "success"
+
+    async def test_end_steps_computes_removed_ratio(self, session: AsyncSession) -> None:
+        """end_steps applies completion data including removed_ratio."""
+        started = datetime.now(timezone.utc)
+        run_id = uuid4()
+        step_id = uuid4()
+        await store.create_run(
+            session, id=run_id, pipeline_name="bulk", status="running", started_at=started
+        )
+        await store.create_step(
+            session,
+            id=step_id,
+            run_id=run_id,
+            step_name="filter",
+            step_type="filter",
+            index=0,
+            started_at=started,
+            input_count=100,
+        )
+
+        steps = await store.end_steps(
+            session,
+            [{"id": step_id, "status": "success", "ended_at": started, "output_count": 25}],
+        )
+
+        assert steps[step_id].removed_ratio == 0.75
+        assert steps[step_id].run_id == run_id
+
+
 class TestGetRun:
     """Tests for store.get_run()."""
 
@@ -798,6 +911,49 @@ class TestCreatePayloads:
         assert created[0].ref_id == "p-003"
         assert len(created[0].data["items"]) == 200
 
+    async def test_create_payload_rows_mixed_owners(self, session: AsyncSession) -> None:
+        """create_payload_rows inserts payloads for several runs/steps at once."""
+        started = datetime.now(timezone.utc)
+        run_id = uuid4()
+        step_id = uuid4()
+        await store.create_run(
+            session, id=run_id, pipeline_name="test", status="running", started_at=started
+        )
+        await store.create_step(
+            session,
+            id=step_id,
+            run_id=run_id,
+            step_name="filter",
+            step_type="filter",
+            index=0,
+            started_at=started,
+        )
+
+        await store.create_payload_rows(
+            session,
+            [
+                {
+                    "run_id": run_id,
+                    "step_id": None,
+                    "ref_id": "p-run",
+                    "phase": "input",
+                    "data": [1, 2],
+                },
+                {
+                    "run_id": run_id,
+                    "step_id": step_id,
+                    "ref_id": "p-step",
+                    "phase": "output",
+                    "data": {"k": "v"},
+                },
+            ],
+        )
+
+        run_payloads = await store.get_payloads(session, run_id=run_id, step_id=None)
+        step_payloads = await store.get_payloads(session, run_id=run_id, step_id=step_id)
+        assert [(p.ref_id, p.data) for p in run_payloads] == [("p-run", [1, 2])]
+        assert [(p.ref_id, p.data) for p in step_payloads] == [("p-step", {"k": "v"})]
+
 
 class TestGetPayloads:
     """Tests for store.get_payloads()."""
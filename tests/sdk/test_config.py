@@ -1,5 +1,7 @@
 """Tests for SDK configuration."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -38,6 +40,45 @@ class TestXRayConfig:
         assert config.batch_size == 50
         assert config.http_timeout == 15.0
 
+    def test_is_immutable(self) -> None:
+        """Config cannot be modified after creation."""
+        config = XRayConfig()
+        with pytest.raises(AttributeError):
+            config.buffer_size = 1
+
+    def test_compress_is_opt_in(self) -> None:
+        """Gzip compression is off unless enabled."""
+        assert XRayConfig().compress is False
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("false", False), ("Off", False), ("true", True), ("1", True)]
+    )
+    def test_coerces_compress_strings(self, value: str, expected: bool) -> None:
+        """String values for compress are parsed rather than taken as truthy."""
+        assert XRayConfig(compress=value).compress is expected
+
+    def test_coerces_numeric_strings(self) -> None:
+        """Numeric fields accept strings that parse as numbers."""
+        config = XRayConfig(buffer_size="50", flush_interval="2.5")
+        assert config.buffer_size == 50
+        assert config.flush_interval == 2.5
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"buffer_size": "lots"}, ValueError),
+            ({"batch_size": 1.5}, ValueError),
+            ({"http_timeout": None}, TypeError),
+            ({"flush_interval": True}, TypeError),
+            ({"base_url": 8000}, TypeError),
+            ({"compress": "maybe"}, ValueError),
+        ],
+    )
+    def test_rejects_invalid_values(self, kwargs: dict, error: type[Exception]) -> None:
+        """Values that cannot be coerced to the field type are rejected."""
+        with pytest.raises(error):
+            XRayConfig(**kwargs)
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -122,6 +163,14 @@ api:
         assert config.base_url == "http://sdk:8000"
         assert not hasattr(config, "database_url")
 
+    def test_ignores_unknown_sdk_keys(self, tmp_path: Path) -> None:
+        """Unknown keys in the sdk section are ignored."""
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text("sdk:\n  base_url: http://sdk:8000\n  unknown_option: 1\n")
+
+        config = load_config(config_file=config_file)
+        assert config.base_url == "http://sdk:8000"
+
 
 class TestConfigImports:
     """Tests for config module imports."""
@@ -132,3 +181,34 @@ class TestConfigImports:
 
         assert XRayConfig is not None
         assert load_config is not None
+
+    def test_import_skips_pydantic_and_yaml(self) -> None:
+        """Importing the SDK config loads neither pydantic nor PyYAML."""
+        code = (
+            "import sys, sdk.config; "
+            "print(sorted(m for m in ('pydantic', 'yaml') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_package_import_is_lazy(self) -> None:
+        """Importing XRayConfig from the package skips transport and middleware deps."""
+        code = (
+            "import sys; from sdk import XRayConfig; "
+            "print(sorted(m for m in ('httpx', 'starlette') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_package_exports_resolve(self) -> None:
+        """Every name in sdk.__all__ resolves through the lazy re-exports."""
+        import sdk
+
+        for name in sdk.__all__:
+            assert getattr(sdk, name) is not None
+        with pytest.raises(AttributeError):
+            sdk.does_not_exist  # noqa: B018
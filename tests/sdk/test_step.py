@@ -1,6 +1,9 @@
 """Tests for SDK Step class and payload helpers."""
 
 import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
 from unittest.mock import Mock
 
 import pytest
@@ -13,6 +16,8 @@ from sdk._internal.step import (
     STRING_PREVIEW_SIZE,
     PayloadCollector,
     Step,
+    _format_iso_utc,
+    _new_id,
     extract_candidate,
     infer_count,
     is_candidate_list,
@@ -86,6 +91,11 @@ class TestIsCandidateList:
         items = [{"name": "a"}, {"name": "b"}]
         assert is_candidate_list(items) is False
 
+    def test_list_with_later_non_candidates_returns_false(self) -> None:
+        """Only the first item looking like a candidate is not enough."""
+        assert is_candidate_list([{"id": "1"}, {"name": "b"}]) is False
+        assert is_candidate_list([{"id": "1"}, "2"]) is False
+
     def test_non_list_returns_false(self) -> None:
         assert is_candidate_list({"id": "1"}) is False
         assert is_candidate_list("hello") is False
@@ -122,6 +132,20 @@ class TestExtractCandidate:
         result = extract_candidate({"id": "1"})
         assert result["reason"] is None
 
+    def test_alternate_field_names(self) -> None:
+        result = extract_candidate({"doc_id": "7", "rank": 2, "why": "close"})
+        assert result == {"id": "7", "score": 2, "reason": "close"}
+
+    def test_first_priority_field_wins(self) -> None:
+        item = {"_id": "b", "id": "a", "rank": 1, "score": 2, "why": "y", "reason": "r"}
+        assert extract_candidate(item) == {"id": "a", "score": 2, "reason": "r"}
+
+    @pytest.mark.parametrize("item", [{"id": 0, "score": 0}, {"_id": 0, "score": 0.0}])
+    def test_falsy_values_are_kept(self, item) -> None:
+        """A present field wins even when falsy; no fallback to later names."""
+        result = extract_candidate({**item, "relevance": 0.9, "reason": ""})
+        assert result == {"id": 0, "score": 0, "reason": ""}
+
 
 class TestSummarizePayload:
     """Tests for summarize_payload helper."""
@@ -188,6 +212,17 @@ class TestSummarizePayload:
         assert result["_count"] == 1000
         assert len(result["_candidates"]) == 1000
 
+    def test_candidate_list_matches_extract_candidate(self) -> None:
+        """Every candidate schema summarizes exactly as extract_candidate does."""
+        candidates = [
+            {"id": "1", "relevance": 0.5, "explanation": "close"},
+            {"_id": "2", "score": 0.4},
+            {"candidate_id": "3", "score": 0, "reason": None},
+            {"id": "4", "score": 0, "confidence": 0.9},
+        ]
+        result = summarize_payload(candidates)
+        assert result["_candidates"] == [extract_candidate(c) for c in candidates]
+
     def test_non_candidate_list(self) -> None:
         """Small non-candidate lists now store ALL values inline."""
         items = [1, 2, 3, 4, 5]
@@ -231,6 +266,31 @@ class TestSummarizePayload:
         # Should not crash and should handle depth
         assert "_type" in result
 
+    def test_scalar_summaries_are_fresh_dicts(self) -> None:
+        """Scalar fast path never hands out a shared summary dict."""
+        for value in (None, True, 7):
+            first = summarize_payload(value)
+            first["_value"] = "changed"
+            assert summarize_payload(value)["_value"] == value
+
+    def test_subclasses_summarized_like_base_types(self) -> None:
+        """Subclasses miss the exact-type dispatch but take the same paths."""
+
+        class Level(IntEnum):
+            HIGH = 3
+
+        class Label(str):
+            pass
+
+        class Candidates(list):
+            pass
+
+        assert summarize_payload(Level.HIGH) == {"_type": "Level", "_value": Level.HIGH}
+        assert summarize_payload(Label("hi"))["_value"] == "hi"
+        result = summarize_payload(Candidates([{"id": "1"}]))
+        assert result["_type"] == "candidates"
+        assert summarize_payload({"level": Level.HIGH})["_values"]["level"] is Level.HIGH
+
 
 class TestStep:
     """Tests for Step class."""
@@ -251,6 +311,15 @@ class TestStep:
         step = Step(mock_run, mock_transport, "test", StepType.filter, [1, 2, 3], 0)
         assert len(step.id) == 36  # UUID format
 
+    def test_new_id_is_random_uuid4(self) -> None:
+        ids = [_new_id() for _ in range(1000)]
+        assert len(set(ids)) == len(ids)
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert str(parsed) == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
     def test_step_properties(self, mock_run, mock_transport) -> None:
         step = Step(mock_run, mock_transport, "my_step", StepType.rank, [], 0)
         assert step.name == "my_step"
@@ -258,6 +327,22 @@ class TestStep:
         assert step.run_id == "run-123"
         assert step.status == StepStatus.running
 
+    def test_step_has_no_instance_dict(self, mock_run, mock_transport) -> None:
+        step = Step(mock_run, mock_transport, "test", StepType.filter, [], 0)
+        assert not hasattr(step, "__dict__")
+        with pytest.raises(AttributeError):
+            step.unknown = 1
+
+    def test_step_type_and_status_accept_strings(self, mock_run, mock_transport) -> None:
+        step = Step(mock_run, mock_transport, "test", "rank", [], 0)
+        assert step.step_type is StepType.rank
+        step.end(status="error")
+        assert step.status is StepStatus.error
+
+    def test_unknown_step_type_raises(self, mock_run, mock_transport) -> None:
+        with pytest.raises(ValueError):
+            Step(mock_run, mock_transport, "test", "not-a-type", [], 0)
+
     def test_step_sends_start_event(self, mock_run, mock_transport) -> None:
         Step(mock_run, mock_transport, "test", StepType.filter, [1, 2, 3], 0)
 
@@ -269,6 +354,40 @@ class TestStep:
         assert event["input_count"] == 3
         assert event["index"] == 0
 
+    def test_step_event_timestamps_are_utc_iso(self, mock_run, mock_transport) -> None:
+        before = datetime.now(timezone.utc)
+        step = Step(mock_run, mock_transport, "test", StepType.filter, [], 0)
+        step.end([1])
+        after = datetime.now(timezone.utc)
+
+        start_event, end_event = (c[0][0] for c in mock_transport.send.call_args_list)
+        started_at = datetime.fromisoformat(start_event["started_at"])
+        ended_at = datetime.fromisoformat(end_event["ended_at"])
+        assert before - timedelta(seconds=1) <= started_at <= ended_at <= after
+        assert started_at.tzinfo == timezone.utc
+
+    @pytest.mark.parametrize(
+        "timestamp_ns",
+        [0, 1_700_000_000_000_000_000, 1_700_000_000_123_456_789, 1_700_000_001_000_000_999],
+    )
+    def test_format_iso_utc_matches_isoformat(self, timestamp_ns: int) -> None:
+        expected = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(
+            microseconds=timestamp_ns // 1000
+        )
+        assert _format_iso_utc(timestamp_ns) == expected.isoformat()
+
+    def test_step_skips_summaries_when_not_collecting(self, mock_run, mock_transport) -> None:
+        mock_transport.is_collecting = False
+        step = Step(mock_run, mock_transport, "test", StepType.filter, [1, 2, 3], 0)
+        step.end([1])
+
+        start_event, end_event = (c[0][0] for c in mock_transport.send.call_args_list)
+        assert start_event["input_summary"] is None
+        assert start_event["input_count"] is None
+        assert end_event["output_summary"] is None
+        assert end_event["output_count"] is None
+        assert end_event["status"] == "success"
+
     def test_step_end_calculates_duration(self, mock_run, mock_transport) -> None:
         step = Step(mock_run, mock_transport, "test", StepType.filter, [], 0)
         time.sleep(0.01)  # Small delay
@@ -6,7 +6,7 @@ import httpx
 import pytest
 import respx
 
-from sdk._internal.transport import Transport
+from sdk._internal.transport import COMPRESS_MIN_BYTES, Transport
 from sdk.config import XRayConfig
 
 
@@ -23,11 +23,11 @@ class TestTransportInit:
         assert not transport.is_started
 
     def test_queue_size_matches_config(self) -> None:
-        """Queue maxsize matches config buffer_size."""
+        """Queue limit matches config buffer_size."""
         config = XRayConfig(buffer_size=50)
         transport = Transport(config)
 
-        assert transport._queue.maxsize == 50
+        assert transport._buffer_size == 50
 
 
 class TestTransportStart:
@@ -78,6 +78,20 @@ class TestTransportStart:
 
         await transport.shutdown()
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("base_url", "expected"), [("http://localhost:8000", True), (None, False)]
+    )
+    async def test_is_collecting(self, base_url: str | None, expected: bool) -> None:
+        """Only a started transport with a base_url is collecting."""
+        transport = Transport(XRayConfig(base_url=base_url))
+        assert not transport.is_collecting
+
+        await transport.start()
+        assert transport.is_collecting is expected
+
+        await transport.shutdown()
+
 
 class TestTransportSend:
     """Tests for Transport.send()."""
@@ -142,6 +156,29 @@ class TestTransportSend:
 
         await transport.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_send_from_threads(self) -> None:
+        """Events sent concurrently from several threads are all queued."""
+        import threading
+
+        config = XRayConfig(base_url="http://localhost:8000", buffer_size=1000)
+        transport = Transport(config)
+        await transport.start()
+
+        def send_many() -> None:
+            for i in range(100):
+                transport.send({"id": i})
+
+        threads = [threading.Thread(target=send_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert transport.queue_size == 400
+
+        await transport.shutdown()
+
 
 class TestTransportFlush:
     """Tests for Transport flush behavior."""
@@ -198,6 +235,102 @@ class TestTransportFlush:
 
         await transport.shutdown()
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_flush_body_is_json(self, respx_mock: respx.MockRouter) -> None:
+        """Flushed body is a JSON array with the event values intact."""
+        requests: list[httpx.Request] = []
+
+        def capture_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        respx_mock.post("http://localhost:8000/ingest").mock(side_effect=capture_request)
+
+        config = XRayConfig(base_url="http://localhost:8000", flush_interval=0.1)
+        transport = Transport(config)
+        await transport.start()
+
+        event = {"id": "e-1", "name": "café", "score": 0.5, "nested": {"ok": True, "none": None}}
+        transport.send(event)
+        await asyncio.sleep(0.3)
+
+        import json
+
+        assert len(requests) == 1
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == [event]
+
+        await transport.shutdown()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_flush_keeps_non_finite_floats(self, respx_mock: respx.MockRouter) -> None:
+        """NaN and Infinity are encoded as the stdlib json module does, not dropped."""
+        requests: list[httpx.Request] = []
+
+        def capture_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        respx_mock.post("http://localhost:8000/ingest").mock(side_effect=capture_request)
+
+        config = XRayConfig(base_url="http://localhost:8000", flush_interval=0.1)
+        transport = Transport(config)
+        await transport.start()
+
+        transport.send({"id": "e-1", "score": float("nan"), "limit": float("inf")})
+        await asyncio.sleep(0.3)
+
+        import json
+        import math
+
+        assert len(requests) == 1
+        assert b"NaN" in requests[0].content and b"Infinity" in requests[0].content
+        (sent,) = json.loads(requests[0].content)
+        assert math.isnan(sent["score"])
+        assert sent["limit"] == float("inf")
+
+        await transport.shutdown()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compress", [True, False])
+    async def test_large_batch_gzip(self, respx_mock: respx.MockRouter, compress: bool) -> None:
+        """Bodies of COMPRESS_MIN_BYTES or more are gzipped unless disabled."""
+        requests: list[httpx.Request] = []
+
+        def capture_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        respx_mock.post("http://localhost:8000/ingest").mock(side_effect=capture_request)
+
+        config = XRayConfig(
+            base_url="http://localhost:8000", flush_interval=0.1, compress=compress
+        )
+        transport = Transport(config)
+        await transport.start()
+
+        events = [{"id": i, "text": "x" * 100} for i in range(20)]
+        for event in events:
+            transport.send(event)
+        await asyncio.sleep(0.3)
+
+        import gzip
+        import json
+
+        assert len(requests) == 1
+        body = requests[0].content
+        assert len(body) < COMPRESS_MIN_BYTES if compress else len(body) > COMPRESS_MIN_BYTES
+        if compress:
+            assert requests[0].headers["Content-Encoding"] == "gzip"
+            body = gzip.decompress(body)
+        else:
+            assert "Content-Encoding" not in requests[0].headers
+        assert json.loads(body) == events
+
+        await transport.shutdown()
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_flush_handles_network_error(
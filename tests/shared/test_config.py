@@ -1,11 +1,16 @@
 """Tests for shared configuration utilities."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
+import yaml
 
 from shared.config import (
     CONFIG_FILENAME,
+    clear_config_cache,
     find_config_file,
     get_section,
     load_yaml_file,
@@ -49,6 +54,35 @@ class TestFindConfigFile:
         result = find_config_file(tmp_path)
         assert result is None
 
+    def test_memoizes_lookup(self, tmp_path: Path) -> None:
+        """Repeated lookups from the same directory reuse the first file found."""
+        (tmp_path / CONFIG_FILENAME).write_text("sdk: {}")
+        child_dir = tmp_path / "child"
+        child_dir.mkdir()
+        assert find_config_file(child_dir) == tmp_path / CONFIG_FILENAME
+
+        (child_dir / CONFIG_FILENAME).write_text("sdk: {}")
+        assert find_config_file(child_dir) == tmp_path / CONFIG_FILENAME
+
+        clear_config_cache()
+        assert find_config_file(child_dir) == child_dir / CONFIG_FILENAME
+
+    def test_config_created_after_miss_is_found(self, tmp_path: Path) -> None:
+        """A miss is not memoized, so a config file created later is found."""
+        assert find_config_file(tmp_path) is None
+
+        (tmp_path / CONFIG_FILENAME).write_text("sdk: {}")
+        assert find_config_file(tmp_path) == tmp_path / CONFIG_FILENAME
+
+    def test_deleted_config_is_not_returned(self, tmp_path: Path) -> None:
+        """A memoized config file that was deleted is not returned."""
+        config_file = tmp_path / CONFIG_FILENAME
+        config_file.write_text("sdk: {}")
+        assert find_config_file(tmp_path) == config_file
+
+        config_file.unlink()
+        assert find_config_file(tmp_path) is None
+
 
 class TestLoadYamlFile:
     """Tests for load_yaml_file function."""
@@ -84,6 +118,17 @@ api:
         result = load_yaml_file(config_file)
         assert result == {}
 
+    def test_blank_file_skips_yaml_parser(self, tmp_path: Path, monkeypatch) -> None:
+        """Whitespace-only files return {} without invoking PyYAML."""
+        config_file = tmp_path / "blank.yaml"
+        config_file.write_text("  \n\n")
+
+        def failing_load(stream, **kwargs):
+            raise AssertionError("yaml.load should not be called")
+
+        monkeypatch.setattr(yaml, "load", failing_load)
+        assert load_yaml_file(config_file) == {}
+
     def test_returns_empty_dict_for_list_yaml(self, tmp_path: Path) -> None:
         """Returns empty dict when YAML contains a list instead of dict."""
         config_file = tmp_path / "list.yaml"
@@ -100,6 +145,66 @@ api:
         result = load_yaml_file(config_file)
         assert result == {}
 
+    def test_reuses_parse_for_unchanged_file(self, tmp_path: Path, monkeypatch) -> None:
+        """Repeated loads of an unchanged file parse YAML only once."""
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("sdk:\n  base_url: http://cached")
+
+        calls = 0
+        original_load = yaml.load
+
+        def counting_load(stream, **kwargs):
+            nonlocal calls
+            calls += 1
+            return original_load(stream, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        first = load_yaml_file(config_file)
+        second = load_yaml_file(config_file)
+        assert first == second == {"sdk": {"base_url": "http://cached"}}
+        assert calls == 1
+
+    def test_reloads_when_file_modified(self, tmp_path: Path) -> None:
+        """A changed mtime invalidates the cached parse."""
+        config_file = tmp_path / "changing.yaml"
+        config_file.write_text("sdk:\n  buffer_size: 1")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        assert load_yaml_file(config_file)["sdk"]["buffer_size"] == 1
+
+        config_file.write_text("sdk:\n  buffer_size: 2")
+        os.utime(config_file, ns=(2_000_000_000, 2_000_000_000))
+        assert load_yaml_file(config_file)["sdk"]["buffer_size"] == 2
+
+    def test_reloads_when_size_changes_within_same_mtime(self, tmp_path: Path) -> None:
+        """A rewrite that keeps the mtime but changes the size is re-parsed."""
+        config_file = tmp_path / "resized.yaml"
+        config_file.write_text("sdk:\n  buffer_size: 1")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        assert load_yaml_file(config_file)["sdk"]["buffer_size"] == 1
+
+        config_file.write_text("sdk:\n  buffer_size: 100")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+        assert load_yaml_file(config_file)["sdk"]["buffer_size"] == 100
+
+    def test_mutating_result_does_not_affect_cache(self, tmp_path: Path) -> None:
+        """Callers can mutate the returned dict without corrupting later loads."""
+        config_file = tmp_path / "mutable.yaml"
+        config_file.write_text("api:\n  debug: false")
+
+        result = load_yaml_file(config_file)
+        result["api"]["debug"] = True
+
+        assert load_yaml_file(config_file) == {"api": {"debug": False}}
+
+    def test_yaml_not_imported_until_needed(self) -> None:
+        """Importing the config module alone does not import PyYAML."""
+        code = "import sys, shared.config; print('yaml' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestGetSection:
     """Tests for get_section function."""
@@ -135,6 +135,7 @@ class TestEnumInteroperability:
             "CONFIG_FILENAME",
             "find_config_file",
             "load_yaml_file",
+            "clear_config_cache",
             "get_section",
         }
         assert set(__all__) == expected